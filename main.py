@@ -27,6 +27,8 @@ from svc.doc_processor import extract_text
 from utils.auth import AuthContext, get_auth_context
 from utils.logger import setup_logger
 from utils.payments import PAYMENT_PACKAGES, PaymentPackage, get_package
+from verifiers.secondary_sources_verifier import close_loc_client
+from verifiers.state_law_verifier import close_async_openai_client
 
 logger = setup_logger()
 
@@ -119,6 +121,12 @@ def on_startup() -> None:
     Base.metadata.create_all(bind=engine)
 
 
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await close_loc_client()
+    await close_async_openai_client()
+
+
 @app.get("/api/health")
 async def health_check() -> Dict[str, Any]:
     """Health check endpoint that verifies configuration."""
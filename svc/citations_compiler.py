@@ -37,8 +37,8 @@ from verifiers.federal_law_verifier import (
     classify_full_law_jurisdiction,
     verify_federal_law_citation,
 )
-from verifiers.journal_verifier import verify_journal_citation
-from verifiers.state_law_verifier import verify_state_law_citation
+from verifiers.journal_verifier import verify_journal_citations_batch
+from verifiers.state_law_verifier import verify_state_law_citations_batch_async
 
 logger = get_logger()
 
@@ -46,26 +46,38 @@ _AdjustedSpans = Dict[int, Tuple[int, int]]
 
 # --- async helpers -------------------------------------------------
 
-async def _verify_state_async(
-    resource_key: str,
-    primary_full: Any,
-    normalized_key: str | None,
-    resource_dict: Dict[str, Any],
-    fallback_citation: str | None,
-) -> Tuple[str, str, str | None, Dict[str, Any] | None]:
-    """Run the state law verifier off the main event loop."""
+async def _verify_state_batch_async(
+    state_items: List[Tuple[str, Any, str | None, Dict[str, Any], str | None]],
+) -> List[Tuple[str, str, str | None, Dict[str, Any] | None]]:
+    """Verify all state law citations with concurrent batched OpenAI requests."""
     try:
-        status, substatus, details = await asyncio.to_thread(
-            verify_state_law_citation,
-            primary_full,
-            normalized_key,
-            resource_dict,
-            fallback_citation=fallback_citation,
+        results = await verify_state_law_citations_batch_async(
+            [item[1:] for item in state_items]
         )
     except Exception as exc:  # pragma: no cover - defensive safeguard
-        logger.exception("State law verification task failed for %s: %s", resource_key, exc)
-        status, substatus, details = "error", "state_law_async_failed", None
-    return resource_key, status, substatus, details
+        logger.exception("State law verification batch failed: %s", exc)
+        results = [("error", "state_law_async_failed", None)] * len(state_items)
+    return [
+        (resource_key, status, substatus, details)
+        for (resource_key, *_), (status, substatus, details) in zip(state_items, results)
+    ]
+
+async def _verify_secondary_batch_async(
+    secondary_items: List[Tuple[str, SecondaryCitation, str | None, Dict[str, Any]]],
+) -> List[Tuple[str, str, str | None, Dict[str, Any] | None]]:
+    """Verify all full secondary citations together so LOC searches are shared."""
+    from verifiers.secondary_sources_verifier import verify_secondary_citations_batch
+    try:
+        results = await verify_secondary_citations_batch(
+            [(cite, normalized_key, resource_dict) for _, cite, normalized_key, resource_dict in secondary_items]
+        )
+    except Exception as exc:  # pragma: no cover - defensive safeguard
+        logger.exception("Secondary verification batch failed: %s", exc)
+        results = [("error", "secondary_async_failed", None)] * len(secondary_items)
+    return [
+        (resource_key, status, substatus, details)
+        for (resource_key, *_), (status, substatus, details) in zip(secondary_items, results)
+    ]
 
 # --- helper functions ------------------------------------------
 
@@ -514,6 +526,7 @@ def _add_secondary_to_db(
     cite: SecondaryCitation,
     citation_db: Dict[str, Dict[str, Any]],
     is_full: bool,
+    secondary_items: List[Tuple[str, SecondaryCitation, str | None, Dict[str, Any]]] | None = None,
 ) -> None:
     """Add a secondary citation to the citation database.
     
@@ -521,6 +534,8 @@ def _add_secondary_to_db(
         cite: The SecondaryCitation to add.
         citation_db: Citation database to update (modified in place).
         is_full: Whether this is a full citation (vs short form).
+        secondary_items: When given (i.e. inside a running event loop),
+            verification is deferred to a batch and the entry is left pending.
     """
     # Determine resource key
     if cite.antecedent_key and not is_full:
@@ -576,7 +591,12 @@ def _add_secondary_to_db(
     }
     
     # Only verify full citations
-    if is_full:
+    if is_full and secondary_items is not None:
+        status = "pending"
+        substatus = "secondary_verification_pending"
+        verification_details = None
+        secondary_items.append((resource_key, cite, normalized, resource_dict))
+    elif is_full:
         from verifiers.secondary_sources_verifier import verify_secondary_citation
         status, substatus, verification_details = verify_secondary_citation(
             cite, normalized, resource_dict
@@ -825,7 +845,9 @@ async def compile_citations(text: str) -> Dict[str, Any]:
 
     # Step 8: Build citation database in sorted order
     citation_db: Dict[str, Dict[str, Any]] = {}
-    state_tasks = []
+    state_items: List[Tuple[str, Any, str | None, Dict[str, Any], str | None]] = []
+    secondary_items: List[Tuple[str, SecondaryCitation, str | None, Dict[str, Any]]] = []
+    journal_items: List[Tuple[str, Any, str | None, Dict[str, Any]]] = []
 
     for entry in citation_entries:
         if entry['type'] == 'eyecite':
@@ -887,16 +909,8 @@ async def compile_citations(text: str) -> Dict[str, Any]:
                     status = "pending"
                     substatus = "state_law_verification_pending"
                     verification_details = None
-                    state_tasks.append(
-                        asyncio.create_task(
-                            _verify_state_async(
-                                resource_key,
-                                primary_full,
-                                normalized_key,
-                                resource_dict,
-                                fallback_value,
-                            )
-                        )
+                    state_items.append(
+                        (resource_key, primary_full, normalized_key, resource_dict, fallback_value)
                     )
                 else:
                     logger.info(f"Unsupported jurisdiction for resource_key: {resource_key}")
@@ -907,11 +921,10 @@ async def compile_citations(text: str) -> Dict[str, Any]:
                     }
 
             elif entry_type == "journal":
-                status, substatus, verification_details = verify_journal_citation(
-                    primary_full,
-                    normalized_key,
-                    resource_dict,
-                )
+                status = "pending"
+                substatus = "journal_verification_pending"
+                verification_details = None
+                journal_items.append((resource_key, primary_full, normalized_key, resource_dict))
 
             citation_db[resource_key] = {
                 "type": entry_type,
@@ -947,11 +960,39 @@ async def compile_citations(text: str) -> Dict[str, Any]:
             # Process secondary citation
             cite = entry['citation']
             is_full = (entry['type'] == 'secondary_full')
-            _add_secondary_to_db(cite, citation_db, is_full)
+            _add_secondary_to_db(cite, citation_db, is_full, secondary_items)
+
+    # Verify state law citations concurrently on the event loop
+    state_task = (
+        asyncio.create_task(_verify_state_batch_async(state_items))
+        if state_items
+        else None
+    )
+
+    # Verify secondary sources in one batch so identical LOC searches are shared
+    secondary_task = (
+        asyncio.create_task(_verify_secondary_batch_async(secondary_items))
+        if secondary_items
+        else None
+    )
+
+    # Complete journal verifications in one batch so lookups are shared. The
+    # journal verifier is blocking (it sleeps between Semantic Scholar calls),
+    # so run it in a worker thread while the state and secondary tasks proceed.
+    if journal_items:
+        journal_results = await asyncio.to_thread(
+            verify_journal_citations_batch,
+            [(primary_full, normalized_key, resource_dict) for _, primary_full, normalized_key, resource_dict in journal_items],
+        )
+        for (resource_key_journal, *_), (status, substatus, verification_details) in zip(journal_items, journal_results):
+            entry = citation_db[resource_key_journal]
+            entry["status"] = status
+            entry["substatus"] = substatus
+            entry["verification_details"] = verification_details
 
     # Complete state law verifications
-    if state_tasks:
-        for resource_key_task, status, substatus, verification_details in await asyncio.gather(*state_tasks):
+    if state_task is not None:
+        for resource_key_task, status, substatus, verification_details in await state_task:
             entry = citation_db.get(resource_key_task)
             if not entry:
                 logger.error("State verification completed for unknown resource_key %s", resource_key_task)
@@ -960,6 +1001,17 @@ async def compile_citations(text: str) -> Dict[str, Any]:
             entry["substatus"] = substatus
             entry["verification_details"] = verification_details
 
+    # Complete secondary source verifications
+    if secondary_task is not None:
+        for resource_key_task, status, substatus, verification_details in await secondary_task:
+            entry = citation_db.get(resource_key_task)
+            if not entry:
+                logger.error("Secondary verification completed for unknown resource_key %s", resource_key_task)
+                continue
+            entry["status"] = status
+            entry["substatus"] = substatus
+            entry["verification_details"] = verification_details
+
     logger.info("Citation compilation complete: %d unique citations", len(citation_db))
 
     return citation_db
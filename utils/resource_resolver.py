@@ -68,6 +68,42 @@ def get_journal_author_title(obj) -> Dict[str, str | None] | None:
 
     return {"author": author, "title": title}
 
+_DOI_RE = re.compile(r"\b(10\.\d{4,9}/[^\s\"<>]+)", re.IGNORECASE)
+_DOI_WINDOW = 200
+# Where the citation's clause ends, so a DOI from a later citation is not used
+_DOI_WINDOW_END_RE = re.compile(r"\n|;\s|\.\s|\s[Ss]ee\b|\bId\.")
+
+
+def get_journal_doi(obj) -> str | None:
+    """
+    Extract a DOI that directly follows a journal citation, if any.
+
+    Looks in the text after the citation span, up to the end of its sentence
+    or clause (line break, "; ", ". ", a "See" signal or "Id."), for forms
+    such as "doi:10.1000/xyz" or "https://doi.org/10.1000/xyz".
+    """
+    if not isinstance(obj, FullJournalCitation):
+        return None
+
+    document = getattr(obj, "document", None)
+    text = getattr(document, "plain_text", None)
+    if not text:
+        return None
+
+    span = get_span(obj)
+    if not span:
+        return None
+
+    _, end = span
+    window = text[end:end + _DOI_WINDOW]
+    boundary = _DOI_WINDOW_END_RE.search(window)
+    if boundary:
+        window = window[:boundary.start()]
+    match = _DOI_RE.search(window)
+    if not match:
+        return None
+    return match.group(1).rstrip(".,;)]")
+
 def _find_citation_start(text: str) -> int:
     """Find where the citation begins by looking for citation start markers.
     
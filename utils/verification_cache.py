@@ -0,0 +1,137 @@
+# Copyright © 2025 Phaethon Order LLC. All rights reserved. Provided solely for evaluation. See LICENSE.
+
+"""Persistent cache of verification outcomes backed by a local SQLite file.
+
+Verifiers store results under a namespace (e.g. ``"journal"``) and a key built
+from the normalized citation fields, so citations repeated across documents
+and runs skip the external API round-trip. Cache failures are logged and never
+interrupt verification.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any
+
+from utils.logger import get_logger
+
+logger = get_logger()
+
+_CACHE_PATH_ENV = "VERIFICATION_CACHE_PATH"
+_CACHE_TTL_ENV = "VERIFICATION_CACHE_TTL"
+_DEFAULT_TTL_SECONDS = 30 * 86400
+
+_connection: sqlite3.Connection | None = None
+_connection_lock = threading.Lock()
+
+
+def _load_cache_ttl() -> int:
+    raw_ttl = os.getenv(_CACHE_TTL_ENV)
+    if not raw_ttl:
+        return _DEFAULT_TTL_SECONDS
+    try:
+        parsed = int(raw_ttl)
+    except ValueError:
+        return _DEFAULT_TTL_SECONDS
+    return max(parsed, 0)
+
+
+CACHE_TTL_SECONDS = _load_cache_ttl()
+
+
+def _cache_path() -> str:
+    return os.getenv(_CACHE_PATH_ENV) or os.path.join(tempfile.gettempdir(), "citation_verifier_cache.db")
+
+
+def _get_connection() -> sqlite3.Connection | None:
+    """Open the cache database on first use. Caller must hold ``_connection_lock``."""
+    global _connection
+    if _connection is not None:
+        return _connection
+    path = _cache_path()
+    try:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS verification_cache (
+                namespace TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                ts INTEGER NOT NULL,
+                PRIMARY KEY (namespace, cache_key)
+            )
+            """
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.error("Verification cache disabled: unable to open %s: %s", path, e)
+        return None
+    _connection = conn
+    return conn
+
+
+def make_cache_key(*parts: Any) -> str | None:
+    """Join citation fields into a cache key, or return None if any part is empty."""
+    cleaned = [str(part).strip() for part in parts if part is not None]
+    if len(cleaned) != len(parts) or not all(cleaned):
+        return None
+    return "|".join(cleaned)
+
+
+def get_cached(namespace: str, key: str | None, ttl: int | None = None) -> Any | None:
+    """Return the cached value for ``key`` if present and younger than ``ttl`` seconds."""
+    if not key:
+        return None
+    max_age = CACHE_TTL_SECONDS if ttl is None else ttl
+    with _connection_lock:
+        conn = _get_connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT value, ts FROM verification_cache WHERE namespace = ? AND cache_key = ?",
+                (namespace, key),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error("Verification cache read failed for %s/%s: %s", namespace, key, e)
+            return None
+    if row is None:
+        return None
+    value, ts = row
+    if time.time() - ts > max_age:
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return None
+
+
+def set_cached(namespace: str, key: str | None, value: Any) -> None:
+    """Store a JSON-serializable ``value`` under ``key``, replacing any previous entry."""
+    if not key:
+        return
+    try:
+        payload = json.dumps(value)
+    except (TypeError, ValueError) as e:
+        logger.error("Verification cache skipped unserializable value for %s/%s: %s", namespace, key, e)
+        return
+    with _connection_lock:
+        conn = _get_connection()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO verification_cache (namespace, cache_key, value, ts) VALUES (?, ?, ?, ?)",
+                (namespace, key, payload, int(time.time())),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Verification cache write failed for %s/%s: %s", namespace, key, e)
+
+
+__all__ = ["CACHE_TTL_SECONDS", "get_cached", "make_cache_key", "set_cached"]
@@ -4,7 +4,7 @@ import os
 import random
 import re
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import httpx
 from eyecite.models import FullCitation, FullJournalCitation
@@ -12,14 +12,23 @@ from rapidfuzz import fuzz, process
 
 from utils.cleaner import clean_str, normalize_case_name_for_compare
 from utils.logger import get_logger
-from utils.resource_resolver import get_journal_author_title
+from utils.resource_resolver import get_journal_author_title, get_journal_doi
+from utils.verification_cache import get_cached, make_cache_key, set_cached
 
 logger = get_logger()
 
 _OPENALEX_WORKS_URL = "https://api.openalex.org/works"
 _OPENALEX_SOURCE_URL = "https://api.openalex.org/sources"
+_OPENALEX_DOI_URL = "https://api.openalex.org/works/doi:"
 _OPENALEX_TIMEOUT = httpx.Timeout(15.0, connect=10.0, read=10.0)
 _OPENALEX_MAILTO_ENV = "OPENALEX_MAILTO"
+# Only request the fields read from OpenAlex responses
+_OPENALEX_WORKS_SELECT = "id,title,authorships,biblio,primary_location"
+_OPENALEX_SOURCES_SELECT = "id,display_name"
+_OPENALEX_WORKS_MATCH_PAGE_SIZE = 10
+_OPENALEX_BATCH_SIZE = 25  # volume/page pairs per OR-filtered works request
+_OPENALEX_BATCH_PAGE_SIZE = 200
+_CACHE_NAMESPACE = "journal"
 
 _SEMANTIC_SCHOLAR_BASE_URL = "https://api.semanticscholar.org/graph/v1"
 _SEMANTIC_SCHOLAR_TIMEOUT = httpx.Timeout(10.0, connect=10.0, read=10.0)
@@ -41,6 +50,103 @@ _FIELDS = ",".join([
     "title","year","venue","authors.name","url","externalIds"
 ])
 
+# Resolved once at import, like the other API settings in this package
+_OPENALEX_MAILTO = os.environ.get(_OPENALEX_MAILTO_ENV)
+_S2_API_KEY = os.environ.get(_SEMANTIC_SCHOLAR_API_KEY)
+_S2_HEADERS: Dict[str, str] = {"Accept": "application/json", **({"x-api-key": _S2_API_KEY} if _S2_API_KEY else {})}
+_S2_FIELDS = _DEFAULT_FIELDS_AUTH if _S2_API_KEY else _DEFAULT_FIELDS_BASIC
+# Lucene special characters mapped to their backslash-escaped form
+_S2_ESCAPE_TABLE = {ord(c): "\\" + c for c in '+-=&|!(){}[]^"~*?:\\/'}
+
+def _journal_lookup(
+    primary_full: FullCitation | None,
+) -> Tuple[Tuple[str, ...], str | None, str | None, str | None]:
+    """Return (reporter_full_names, volume, page, year) for a journal citation.
+
+    The tuple is computed once and stored on the citation object, so the
+    OpenAlex and Semantic Scholar helpers share it instead of walking the
+    groups and reporter editions again.
+    """
+    cached = getattr(primary_full, "_journal_lookup", None)
+    if cached is not None:
+        return cached
+
+    reporter_full_name: Tuple[str, ...] = ()
+    reporter_editions = getattr(primary_full, 'all_editions', None)
+    if reporter_editions:
+        reporter_name = getattr(reporter_editions[0], 'reporter', None)
+        full_name = getattr(reporter_name, 'name', None)
+        if full_name:
+            reporter_full_name = (full_name,)
+    if not reporter_full_name:
+        edition_guess = getattr(primary_full, 'edition_guess', None)
+        guess_names = getattr(edition_guess, 'name', None) if edition_guess else None
+        reporter_full_name = tuple(guess_names.split(";")) if guess_names else ()
+
+    groups = getattr(primary_full, 'groups', None) or {}
+    lookup = (
+        reporter_full_name,
+        groups.get('volume'),
+        groups.get('page'),
+        getattr(primary_full, 'year', None),
+    )
+    if primary_full is not None:
+        try:
+            setattr(primary_full, "_journal_lookup", lookup)
+        except AttributeError:
+            pass
+    return lookup
+
+
+def _has_volume_and_page(primary_full: FullCitation | None) -> bool:
+    """Return True when the citation carries the volume and page a journal search needs."""
+    _, volume, page, _ = _journal_lookup(primary_full)
+    return bool(volume and page)
+
+
+def _journal_author_title(
+    primary_full: FullCitation | None,
+    resource_dict: Dict[str, Any] | None,
+) -> Tuple[str | None, str | None]:
+    """Return the citation's (author, title), preferring resource_dict values over the parsed text.
+
+    The parsed (author, title) is stored on the citation object like
+    _journal_lookup, so the document text is scanned at most once per citation.
+    """
+    author = clean_str(resource_dict.get("author")) if resource_dict else None
+    title = clean_str(resource_dict.get("title")) if resource_dict else None
+    if not (author and title):
+        parsed = getattr(primary_full, "_journal_author_title", None)
+        if parsed is None:
+            ji = get_journal_author_title(primary_full) or {}
+            parsed = (clean_str(ji.get("author")), clean_str(ji.get("title")))
+            if primary_full is not None:
+                try:
+                    setattr(primary_full, "_journal_author_title", parsed)
+                except AttributeError:
+                    pass
+        author = author or parsed[0]
+        title = title or parsed[1]
+    return author, title
+
+
+def _journal_cache_key(primary_full: FullCitation | None, *identity: str | None) -> str | None:
+    """Build a persistent-cache key from the normalized journal name, volume and page.
+
+    Results matched on author/title or DOI rather than on volume and page pass
+    those values as `identity`, so they are only reused for the same work.
+    """
+    if not isinstance(primary_full, FullJournalCitation):
+        return None
+    reporter_full_name, volume, page, _ = _journal_lookup(primary_full)
+    return make_cache_key(
+        normalize_case_name_for_compare(reporter_full_name[0] if reporter_full_name else None),
+        clean_str(volume),
+        clean_str(page),
+        *(clean_str(part) or "-" for part in identity),
+    )
+
+
 def _sleep_min_interval(last_ts):
     now = time.time()
     wait = max(0.0, 1.2 - (now - last_ts))
@@ -128,6 +234,55 @@ def _result_matches_citation(
         }
     return "warning", "Unverified details", details
 
+def _verify_doi_with_openalex(
+    doi: str,
+    primary_full: FullCitation | None,
+    title: str | None,
+) -> Tuple[str, str | None, Dict[str, Any] | None] | None:
+    """Look up a work directly by DOI in OpenAlex.
+
+    Returns a verified result when OpenAlex resolves the DOI to a work whose
+    volume and first page, or title, match the citation. Otherwise returns
+    None so the caller can fall back to the search-based pipeline.
+    """
+    params: Dict[str, Any] = {"select": _OPENALEX_WORKS_SELECT}
+    if _OPENALEX_MAILTO:
+        params["mailto"] = _OPENALEX_MAILTO
+
+    try:
+        with httpx.Client(timeout=_OPENALEX_TIMEOUT) as client:
+            response = client.get(f"{_OPENALEX_DOI_URL}{doi}", params=params)
+        if response.status_code != 200:
+            logger.info(f"OpenAlex DOI lookup returned {response.status_code} for doi={doi}")
+            return None
+        data = response.json()
+    except Exception as e:
+        logger.error(f"OpenAlex DOI lookup error: {e} for doi={doi}")
+        return None
+
+    if not isinstance(data, dict) or not data.get("id"):
+        return None
+
+    _, volume, page, _ = _journal_lookup(primary_full)
+    biblio = data.get("biblio") or {}
+    location_matches = bool(
+        volume and page
+        and clean_str(biblio.get("volume")) == clean_str(volume)
+        and clean_str(biblio.get("first_page")) == clean_str(page)
+    )
+    title_norm = normalize_case_name_for_compare(title)
+    work_title_norm = normalize_case_name_for_compare(data.get("title"))
+    title_matches = bool(
+        title_norm and work_title_norm
+        and (title_norm in work_title_norm or work_title_norm in title_norm)
+    )
+    if not (location_matches or title_matches):
+        logger.info(f"OpenAlex DOI work {data.get('id')} does not match the citation for doi={doi}")
+        return None
+
+    logger.info(f"OpenAlex DOI match found: {data.get('id')} for doi={doi}")
+    return "verified", None, {"source": "openalex", "doi": doi, "data": data.get("title")}
+
 def _verify_author_title_with_openalex(
     citation: FullCitation | None, resource_dict: Dict[str, Any] | None
 ) -> Tuple[str, str | None, Dict[str, Any] | None]:
@@ -143,14 +298,7 @@ def _verify_author_title_with_openalex(
         return "no_match", "Not a journal citation", None
 
     # Choose search fields: prefer provided values; fall back to parsed citation.
-    search_author = clean_str(resource_dict.get("author")) if resource_dict else None
-    search_title = clean_str(resource_dict.get("title")) if resource_dict else None
-    if not search_author or not search_title:
-        ji = get_journal_author_title(citation)
-        if not search_author and ji:
-            search_author = clean_str(ji.get("author"))
-        if not search_title and ji:
-            search_title = clean_str(ji.get("title"))
+    search_author, search_title = _journal_author_title(citation, resource_dict)
 
     if not search_author and not search_title:
         return _verify_journal_citation_with_openalex(citation, resource_dict)
@@ -170,10 +318,9 @@ def _verify_author_title_with_openalex(
     filter_str = ",".join(filter_parts)
 
     # Build the request parameters
-    mailto = os.environ.get(_OPENALEX_MAILTO_ENV)
-    params: Dict[str, Any] = {"filter": filter_str, "per-page": 25, "cursor": "*"}
-    if mailto:
-        params["mailto"] = mailto
+    params: Dict[str, Any] = {"filter": filter_str, "per-page": 25, "select": _OPENALEX_WORKS_SELECT}
+    if _OPENALEX_MAILTO:
+        params["mailto"] = _OPENALEX_MAILTO
 
     logger.info(f"Querying OpenAlex with params: {params}")
 
@@ -195,68 +342,28 @@ def _verify_author_title_with_openalex(
         return "no_match", "Not found in OpenAlex", {"not found": "title", "source": "openalex"}
 
     # The rest of the function remains the same, as post-filtering is still valuable
-    citation_author = search_author
-    citation_title  = search_title
-    if not (citation_author and citation_title):
-        ji = get_journal_author_title(citation)
-        if not citation_author and ji:
-            citation_author = clean_str(ji.get("author"))
-        if not citation_title and ji:
-            citation_title = clean_str(ji.get("title"))
-
     for idx, result in enumerate(results):
-        if _result_matches_citation(result, citation_author, citation_title):
-            result, _, _ = _result_matches_citation(result, citation_author, citation_title)
-            if result == "verified":
-                logger.info(f"OpenAlex result matched author+title on result index {idx}")
-                return "verified", None, {"source": "openalex", "data": f"{citation_author}, {citation_title}"}
+        match_status, _, _ = _result_matches_citation(result, search_author, search_title)
+        if match_status == "verified":
+            logger.info(f"OpenAlex result matched author+title on result index {idx}")
+            return "verified", None, {"source": "openalex", "data": f"{search_author}, {search_title}"}
 
     logger.info("No OpenAlex result matched author+title after filter search")
     return "no_match", "Not found in OpenAlex", {"source": "openalex"}
 
-def _verify_journal_citation_with_openalex(
-  primary_full: FullCitation | None, resource_dict: Dict[str, Any] | None
-) -> Tuple[str, str | None, Dict[str, Any] | None]:
-    """Verify a citation using the OpenAlex API with targeted, quoted field filters.
-
-    Args:
-        citation: The journal citation to verify.
+def _resolve_openalex_source_id(
+    reporter_full_name: Tuple[str, ...],
+) -> Tuple[str | None, Tuple[str, str | None, Dict[str, Any] | None] | None]:
+    """Find the OpenAlex source ID for the first journal name that matches.
 
     Returns:
-        A tuple of (status, error_message, data) where:
-        - status is "verified" if found, "no_match" if not found, or "error" on failure
-        - error_message is None on success or an error description on failure
-        - data is the OpenAlex work data if verified, otherwise None
+        A tuple of (source_id, error) where error is a verification result
+        tuple to return on HTTP failure, otherwise None.
     """
-    if not isinstance(primary_full, FullJournalCitation):
-        return "no_match", "Not a journal citation", None
-    
-    reporter_full_name = []
-    data = {}
-    logger.info(f"Verifying journal citation with OpenAlex: {primary_full}")
-    groups = getattr(primary_full, 'groups', None)
-    logger.info(f"Primary full groups: {groups}")
-    volume = groups.get('volume') if groups else None
-    logger.info(f"Primary full volume: {volume}")
-    page = groups.get('page') if groups else None
-    logger.info(f"Primary full page: {page}")
-
-    reporter_editions = getattr(primary_full, 'all_editions', None)
-    if reporter_editions and len(reporter_editions) > 0:
-        reporter_name = getattr(reporter_editions[0], 'reporter', None)
-        reporter_full_name = [getattr(reporter_name, 'name', None)] if reporter_name else None
-
-    if reporter_full_name == []:
-        edition_guess = getattr(primary_full, 'edition_guess', None)
-        if edition_guess:
-            guess_names = getattr(edition_guess, 'name', None)
-            reporter_full_name = guess_names.split(";") if guess_names else []
-
-    logger.info(f"OpenAlex source search for reporter_full_name={reporter_full_name},volume={str(volume)},page={str(page)}")
-    source_id = None
-    mailto = os.environ.get(_OPENALEX_MAILTO_ENV, "admin@phaethon.llc")
-    params: Dict[str, Any] = {"filter": "", "per-page": 100, "cursor": "*", "mailto": mailto}
-    for name in reporter_full_name if reporter_full_name else []:
+    mailto = _OPENALEX_MAILTO or "admin@phaethon.llc"
+    # Only the top-ranked source is inspected, so fetch just that one.
+    params: Dict[str, Any] = {"filter": "", "per-page": 1, "select": _OPENALEX_SOURCES_SELECT, "mailto": mailto}
+    for name in reporter_full_name:
         name = clean_str(str(name))
         params["filter"] = f"display_name.search:{name}"
         try:
@@ -272,30 +379,62 @@ def _verify_journal_citation_with_openalex(
                     if similarity:
                         logger.info(f"OpenAlex source match found: {returned_name} for name='{name}' with similarity={similarity}")
                         source_url = first_result["id"]
-                        source_id = source_url.rsplit("/", 1)[-1] 
+                        source_id = source_url.rsplit("/", 1)[-1]
                         logger.info(f"OpenAlex source ID found: {source_id}")
-                        break
-
+                        return source_id, None
 
         except httpx.HTTPError as e:
             logger.error(f"OpenAlex HTTP error: {e} for filter: {name}")
-            return "error", f"openalex http error: {e}", None
+            return None, ("error", f"openalex http error: {e}", None)
         except Exception as e:
             logger.error(f"OpenAlex unknown error: {e} for filter: {name}")
-            return "error", f"openalex error: {e}", None
+            return None, ("error", f"openalex error: {e}", None)
+
+    return None, None
+
 
+def _verify_journal_citation_with_openalex(
+  primary_full: FullCitation | None, resource_dict: Dict[str, Any] | None
+) -> Tuple[str, str | None, Dict[str, Any] | None]:
+    """Verify a citation using the OpenAlex API with targeted, quoted field filters.
+
+    Args:
+        citation: The journal citation to verify.
+
+    Returns:
+        A tuple of (status, error_message, data) where:
+        - status is "verified" if found, "no_match" if not found, or "error" on failure
+        - error_message is None on success or an error description on failure
+        - data is the OpenAlex work data if verified, otherwise None
+    """
+    if not isinstance(primary_full, FullJournalCitation):
+        return "no_match", "Not a journal citation", None
     
+    logger.info(f"Verifying journal citation with OpenAlex: {primary_full}")
+    reporter_full_name, volume, page, _ = _journal_lookup(primary_full)
+    logger.info(f"Primary full volume: {volume}")
+    logger.info(f"Primary full page: {page}")
+
+    logger.info(f"OpenAlex source search for reporter_full_name={reporter_full_name},volume={str(volume)},page={str(page)}")
+    mailto = _OPENALEX_MAILTO or "admin@phaethon.llc"
+    source_id, source_error = _resolve_openalex_source_id(reporter_full_name)
+    if source_error is not None:
+        return source_error
+
     logger.info(f"OpenAlex source search results reporter_full_name='{reporter_full_name}: Source ID={source_id}'")
+    if source_id is None:
+        return "no_match", "unknown journal source in openalex", {"source": "openalex"}
 
     filter = f"primary_location.source.id:{source_id},biblio.volume:{str(volume)},biblio.first_page:{str(page)}"
 
-    params_works: Dict[str, Any] = {"filter": filter, "per-page": 100, "cursor": "*", "mailto": mailto}
+    # The filter already pins source, volume and first page, so a small page suffices.
+    params_works: Dict[str, Any] = {"filter": filter, "per-page": _OPENALEX_WORKS_MATCH_PAGE_SIZE, "select": _OPENALEX_WORKS_SELECT, "mailto": mailto}
     try:
         with httpx.Client(timeout=_OPENALEX_TIMEOUT) as client:
             response = client.get(_OPENALEX_WORKS_URL, params=params_works)
             response.raise_for_status()
         data_works = response.json()
-        logger.info(f"OpenAlex works search response data: {data_works}")
+        logger.info("OpenAlex works search returned %d results", len(data_works.get("results") or []) if isinstance(data_works, dict) else 0)
         if data_works is not None and 'results' in data_works:
             results = data_works['results']
             for result in results:
@@ -329,29 +468,17 @@ def _verify_title_with_semantic_scholar(
         return "no_match", "Not a journal citation", None
 
     # ---- inputs ----
-    search_author = clean_str(resource_dict.get("author")) if resource_dict else None
-    search_title = clean_str(resource_dict.get("title")) if resource_dict else None
-    if not (search_author and search_title):
-        ji = get_journal_author_title(primary_full)
-        if not search_author and ji:
-            search_author = clean_str(ji.get("author"))
-        if not search_title and ji:
-            search_title = clean_str(ji.get("title"))
+    search_author, search_title = _journal_author_title(primary_full, resource_dict)
     if search_author is None and search_title is None:
+        if not _has_volume_and_page(primary_full):
+            return "no_match", "insufficient citation data for search", None
         return _verify_citation_with_semantic_scholar(primary_full, resource_dict)
 
-    # ---- headers ----
-    headers: Dict[str, str] = {"Accept": "application/json"}
-    api_key = os.environ.get(_SEMANTIC_SCHOLAR_API_KEY)  # keep project constant
-    if api_key:
-        headers["x-api-key"] = api_key
-
     # ---- params ----
-    fields = _DEFAULT_FIELDS_AUTH if api_key else _DEFAULT_FIELDS_BASIC  # comma-separated string
     params_search = {
         "query": f"\"{search_title}\"",
         "limit": str(_SEMANTIC_SCHOLAR_MAX_SEARCH),
-        "fields": fields,
+        "fields": _S2_FIELDS,
     }
 
     # ---- normalizers ----
@@ -375,7 +502,7 @@ def _verify_title_with_semantic_scholar(
 
     with httpx.Client(
         timeout=_SEMANTIC_SCHOLAR_TIMEOUT,
-        headers=headers,
+        headers=_S2_HEADERS,
         limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
     ) as client:
         attempt = 0
@@ -500,7 +627,7 @@ def _escape_semantic_scholar_term(term: str) -> str:
     if not term:
         return ""
     # Escape Lucene special characters so the query is always parseable
-    return re.sub(r"([+\-=&|!(){}\[\]^\"~*?:\\\/])", r"\\\1", term)
+    return term.translate(_S2_ESCAPE_TABLE)
 
 def _verify_citation_with_semantic_scholar(
     primary_full: FullCitation | None, 
@@ -519,44 +646,25 @@ def _verify_citation_with_semantic_scholar(
     if not isinstance(primary_full, FullJournalCitation):
         return "no_match", "not a journal citation", None
     
-    reporter_full_name = []
     data = {}
-    logger.info(f"Verifying journal citation with OpenAlex: {primary_full}")
-    groups = getattr(primary_full, 'groups', None)
-    logger.info(f"Primary full groups: {groups}")
-    volume = groups.get('volume') if groups else None
-    logger.info(f"Primary full volume: {volume}")
-    page = groups.get('page') if groups else None
-    logger.info(f"Primary full page: {page}")
-    year = getattr(primary_full, 'year', None)
-    if year is None:
-        year = resource_dict.get('year') if resource_dict else None
-    logger.info(f"Primary full year: {year}")
-
-    reporter_editions = getattr(primary_full, 'all_editions', None)
-    if reporter_editions and len(reporter_editions) > 0:
-        reporter_name = getattr(reporter_editions[0], 'reporter', None)
-        reporter_full_name = [getattr(reporter_name, 'name', None)] if reporter_name else None
-
-    if reporter_full_name == []:
-        edition_guess = getattr(primary_full, 'edition_guess', None)
-        if edition_guess:
-            guess_names = getattr(edition_guess, 'name', None)
-            reporter_full_name = guess_names.split(";") if guess_names else []
-
-    headers = {"Accept": "application/json"}
-    api_key = os.environ.get(_SEMANTIC_SCHOLAR_API_KEY)
-    if api_key:
-        headers["x-api-key"] = api_key
+    logger.info(f"Verifying journal citation with Semantic Scholar: {primary_full}")
+    reporter_full_name, volume, page, year = _journal_lookup(primary_full)
+    if not (volume and page):
+        logger.info(f"Semantic Scholar search skipped: volume={volume}, page={page}")
+        return "no_match", "insufficient citation data for search", None
 
     logger.info(f"Semantic Scholar search for reporter_full_name={reporter_full_name},volume={str(volume)},page={str(page)}")
     journal = clean_str(reporter_full_name[0] if reporter_full_name else None)
-    if not (journal and volume and page):
+    if not journal:
         return "no_match", "insufficient citation data for search", None
 
+    if year is None:
+        year = resource_dict.get('year') if resource_dict else None
+    logger.info(f"Primary full year: {year}")
+
     vol_s = str(volume).strip()
     page_s = str(page).strip()
-    year_str = str(year).strip()
+    year_str = str(year).strip() if year else ""
 
     queries: List[str] = []
 
@@ -592,14 +700,22 @@ def _verify_citation_with_semantic_scholar(
     last_client_error: Optional[str] = None
     last_call = 0.0
 
-    with httpx.Client(timeout=_SEMANTIC_SCHOLAR_TIMEOUT, headers=headers, limits=httpx.Limits(max_connections=1, max_keepalive_connections=1)) as client:
-        for q in queries:
-            params = {
+    # One venue-filtered request usually settles the lookup; the free-text
+    # journal variants are only tried when it comes back empty or rejected.
+    searches: List[Tuple[str, str | None]] = [(queries[0], journal)] if queries else []
+    searches.extend((q, None) for q in queries)
+
+    with httpx.Client(timeout=_SEMANTIC_SCHOLAR_TIMEOUT, headers=_S2_HEADERS, limits=httpx.Limits(max_connections=1, max_keepalive_connections=1)) as client:
+        for q, venue in searches:
+            params: Dict[str, Any] = {
                 "query": q,
                 "limit": _SEMANTIC_SCHOLAR_MAX_SEARCH,
                 "fields": _FIELDS,
-                "year": year_str
             }
+            if year_str:
+                params["year"] = year_str
+            if venue:
+                params["venue"] = venue
             attempt = 0
             while True:
                 last_call = _sleep_min_interval(last_call)
@@ -673,6 +789,35 @@ def verify_journal_citation(
         - data is the OpenAlex work data if verified, otherwise None
     """
 
+    doi = clean_str(resource_dict.get("doi")) if resource_dict else None
+    doi = doi or get_journal_doi(primary_full)
+    author, title = _journal_author_title(primary_full, resource_dict)
+
+    # Author/title matches never checked volume or page, so key them by the
+    # work as well; the bare journal/volume/page key is for volume/page matches.
+    doi_cache_key = _journal_cache_key(primary_full, "doi", doi.casefold()) if doi else None
+    if author or title:
+        cache_key = _journal_cache_key(
+            primary_full,
+            normalize_case_name_for_compare(author),
+            normalize_case_name_for_compare(title),
+        )
+    else:
+        cache_key = _journal_cache_key(primary_full)
+
+    for key in (doi_cache_key, cache_key):
+        cached = get_cached(_CACHE_NAMESPACE, key)
+        if cached is not None:
+            logger.info(f"Journal citation verification served from cache: {key}")
+            return tuple(cached)
+
+    if doi:
+        doi_validation = _verify_doi_with_openalex(doi, primary_full, title)
+        if doi_validation is not None:
+            logger.info(f"Journal citation verified by OpenAlex DOI lookup: {primary_full}")
+            set_cached(_CACHE_NAMESPACE, doi_cache_key, doi_validation)
+            return doi_validation
+
     validation = _verify_author_title_with_openalex(
         citation=primary_full,
         resource_dict=resource_dict,
@@ -680,14 +825,156 @@ def verify_journal_citation(
 
     if validation[0] == "verified":
         logger.info(f"Journal citation verified by OpenAlex: {primary_full}")
+        set_cached(_CACHE_NAMESPACE, cache_key, validation)
         return validation
 
+    return _verify_with_semantic_scholar_fallback(primary_full, resource_dict, cache_key)
+
+
+def _verify_with_semantic_scholar_fallback(
+    primary_full: FullCitation | None,
+    resource_dict: Dict[str, Any] | None,
+    cache_key: str | None,
+) -> Tuple[str, str | None, Dict[str, Any] | None]:
+    """Finish verifying a citation OpenAlex did not verify, using Semantic Scholar."""
     validation = _verify_title_with_semantic_scholar(
         primary_full=primary_full,
         resource_dict=resource_dict,
     )
     if validation[0] == "verified" or validation[0] == "warning":
         logger.info(f"Journal citation verified by Semantic Scholar: {primary_full}")
+        if validation[0] == "verified":
+            set_cached(_CACHE_NAMESPACE, cache_key, validation)
         return validation
 
     return "no_match", "Not found in OpenAlex or Semantic Scholar", None
+
+
+def _match_openalex_works_batch(
+    source_id: str, entries: List[Tuple[str, str, str]]
+) -> Set[str] | None:
+    """Fetch works for several volume/page pairs of one source in a single request.
+
+    Args:
+        source_id: OpenAlex source ID shared by every entry.
+        entries: (cache_key, volume, page) tuples to look up.
+
+    Returns:
+        The cache keys whose volume and first page appear in the results, or
+        None if the request failed.
+    """
+    volumes = "|".join(dict.fromkeys(volume for _, volume, _ in entries))
+    pages = "|".join(dict.fromkeys(page for _, _, page in entries))
+    filter = f"primary_location.source.id:{source_id},biblio.volume:{volumes},biblio.first_page:{pages}"
+    params: Dict[str, Any] = {
+        "filter": filter,
+        "per-page": _OPENALEX_BATCH_PAGE_SIZE,
+        "select": _OPENALEX_WORKS_SELECT,
+        "mailto": _OPENALEX_MAILTO or "admin@phaethon.llc",
+    }
+    try:
+        with httpx.Client(timeout=_OPENALEX_TIMEOUT) as client:
+            response = client.get(_OPENALEX_WORKS_URL, params=params)
+            response.raise_for_status()
+        data = response.json()
+    except Exception as e:
+        logger.error(f"OpenAlex batch works error: {e} for filter search on {source_id}")
+        return None
+
+    found = set()
+    for result in data.get("results", []) if isinstance(data, dict) else []:
+        biblio = result.get("biblio") or {}
+        found.add((str(biblio.get("volume")), str(biblio.get("first_page"))))
+
+    return {key for key, volume, page in entries if (volume, page) in found}
+
+
+def verify_journal_citations_batch(
+    items: List[Tuple[FullCitation | None, str | None, Dict[str, Any] | None]],
+) -> List[Tuple[str, str | None, Dict[str, Any] | None]]:
+    """Verify several journal citations, sharing OpenAlex lookups across them.
+
+    Citations with no author or title, which `verify_journal_citation` would
+    only check by volume and page, are batched: citations with the same
+    journal, volume and page are verified once, the OpenAlex source is
+    resolved once per journal, and each source's volume/page pairs are checked
+    with one OR-filtered works request per chunk. Batched citations OpenAlex
+    answered for but did not verify go on to Semantic Scholar; every other
+    citation goes through `verify_journal_citation`.
+
+    Args:
+        items: (primary_full, normalized_key, resource_dict) tuples.
+
+    Returns:
+        One (status, error_message, data) tuple per item, in input order.
+    """
+    results: List[Tuple[str, str | None, Dict[str, Any] | None] | None] = [None] * len(items)
+    pending: Dict[str, List[int]] = {}
+    for idx, (primary_full, _, resource_dict) in enumerate(items):
+        author, title = _journal_author_title(primary_full, resource_dict)
+        if author or title:
+            continue
+        cache_key = _journal_cache_key(primary_full)
+        if cache_key is None:
+            continue
+        cached = get_cached(_CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            results[idx] = tuple(cached)
+            continue
+        pending.setdefault(cache_key, []).append(idx)
+
+    source_ids: Dict[str, Tuple[str | None, Tuple[str, str | None, Dict[str, Any] | None] | None]] = {}
+    by_source: Dict[str, List[Tuple[str, str, str]]] = {}
+    # Keys whose OpenAlex lookup completed, so a miss need not repeat it
+    checked_keys: Set[str] = set()
+    for cache_key, indexes in pending.items():
+        primary_full = items[indexes[0]][0]
+        reporter_full_name, volume, page, _ = _journal_lookup(primary_full)
+        volume = str(volume).strip()
+        page = str(page).strip()
+        if any(c in volume + page for c in "|,"):
+            continue
+        journal = reporter_full_name[0] if reporter_full_name else ""
+        if journal not in source_ids:
+            source_ids[journal] = _resolve_openalex_source_id(reporter_full_name)
+        source_id, source_error = source_ids[journal]
+        if source_id:
+            by_source.setdefault(source_id, []).append((cache_key, volume, page))
+        elif source_error is None:
+            # OpenAlex does not know the journal, so no works search can match
+            checked_keys.add(cache_key)
+
+    verified_keys: Set[str] = set()
+    for source_id, entries in by_source.items():
+        for start in range(0, len(entries), _OPENALEX_BATCH_SIZE):
+            chunk = entries[start:start + _OPENALEX_BATCH_SIZE]
+            matched = _match_openalex_works_batch(source_id, chunk)
+            if matched is not None:
+                verified_keys |= matched
+                checked_keys.update(cache_key for cache_key, _, _ in chunk)
+
+    logger.info(
+        f"OpenAlex batch verified {len(verified_keys)} of {len(pending)} unique journal citations "
+        f"across {len(by_source)} sources"
+    )
+
+    for cache_key, indexes in pending.items():
+        if cache_key in verified_keys:
+            _, volume, page = cache_key.rsplit("|", 2)
+            validation = ("verified", None, {"source": "openalex", "data": f"volume={volume}, page={page}"})
+            set_cached(_CACHE_NAMESPACE, cache_key, validation)
+        else:
+            primary_full, normalized_key, resource_dict = items[indexes[0]]
+            doi = clean_str(resource_dict.get("doi")) if resource_dict else None
+            if cache_key in checked_keys and not (doi or get_journal_doi(primary_full)):
+                validation = _verify_with_semantic_scholar_fallback(primary_full, resource_dict, cache_key)
+            else:
+                validation = verify_journal_citation(primary_full, normalized_key, resource_dict)
+        for idx in indexes:
+            results[idx] = validation
+
+    for idx, result in enumerate(results):
+        if result is None:
+            results[idx] = verify_journal_citation(*items[idx])
+
+    return results  # type: ignore[return-value]
@@ -9,27 +9,72 @@ the Library of Congress Search API and performing fuzzy matching on results.
 
 from __future__ import annotations
 
-import time
-from typing import Any, Dict, List, Tuple
+import asyncio
+import hashlib
+import re
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
 
 import httpx
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 
 from utils.cleaner import clean_str, normalize_case_name_for_compare
 from utils.logger import get_logger
+from utils.verification_cache import get_cached, set_cached
 
 logger = get_logger()
 
 # Library of Congress Search API configuration
 _LOC_SEARCH_URL = "https://www.loc.gov/search/"
-_LOC_TIMEOUT = httpx.Timeout(15.0, connect=10.0, read=10.0)
+# No pool timeout: batched searches queue for one of the _LOC_LIMITS connections
+_LOC_TIMEOUT = httpx.Timeout(15.0, connect=10.0, read=10.0, pool=None)
 _LOC_MAX_RETRIES = 3
 _LOC_BACKOFF_FACTOR = 2.0
+_LOC_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+_LOC_PAGE_SIZE = 25
+# One pooled client per event loop; AsyncClient connections are loop-bound
+_loc_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+_LOC_BASE_PARAMS = {"fo": "json", "at": "results", "c": _LOC_PAGE_SIZE}
+# LOC searches in flight per event loop, across all citations and batches;
+# a slot is held through retry backoff so 429s slow every search down
+_LOC_MAX_CONCURRENT_SEARCHES = 4
+_loc_search_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Print reference works LOC catalogs as books; narrowing by format lets the
+# server drop manuscripts, photos, web archives, etc. before ranking.
+_LOC_FORMAT_FACETS = {
+    "cjs": "original-format:book",
+    "amjur": "original-format:book",
+    "restatement": "original-format:book",
+}
+
+# LOC search result caching (persistent, with an in-process LRU in front)
+_LOC_CACHE_NAMESPACE = "loc_search"
+_LOC_EMPTY_CACHE_NAMESPACE = "loc_search_empty"
+_LOC_EMPTY_CACHE_TTL = 86400  # Retry queries that found nothing after a day
+_LOC_MEMORY_CACHE_SIZE = 512
+_LOC_RESULT_FIELDS = ("title", "partof", "date", "contributors")
+_loc_memory_cache: OrderedDict[str, List[Dict[str, Any]]] = OrderedDict()
 
 # Match thresholds for fuzzy string matching
 _TITLE_MATCH_THRESHOLD = 72  # Minimum similarity score for title matches
 _CONTAINER_MATCH_THRESHOLD = 65  # Minimum similarity score for container/series
 _AUTHOR_MATCH_THRESHOLD = 70  # Minimum similarity score for author names
+_STRONG_MATCH_CONFIDENCE = 0.85  # Stop searching once a match reaches this
+
+_YEAR_RE = re.compile(r"\b(?:17|18|19|20)\d{2}\b")
+
+# The same titles and source names recur across queries for one citation
+_normalize_for_compare = lru_cache(maxsize=8192)(normalize_case_name_for_compare)
 
 # Source type display names for logging and error messages
 _SOURCE_TYPE_NAMES = {
@@ -39,6 +84,85 @@ _SOURCE_TYPE_NAMES = {
     "restatement": "Restatement",
     "treatise": "Treatise",
 }
+_SOURCE_TYPE_NAMES_LC = {k: v.lower() for k, v in _SOURCE_TYPE_NAMES.items()}
+
+# Published Restatements by edition, used to verify restatement citations
+# locally without a LOC search. Subjects are as cited after "of".
+_RESTATEMENT_INDEX: Dict[str, Tuple[str, ...]] = {
+    "first": (
+        "Agency", "Conflict of Laws", "Contracts", "Judgments", "Property",
+        "Restitution", "Security", "Torts", "Trusts",
+    ),
+    "second": (
+        "Agency", "Conflict of Laws", "Contracts",
+        "Foreign Relations Law of the United States", "Judgments",
+        "Property", "Property: Landlord and Tenant",
+        "Property: Donative Transfers", "Torts", "Trusts",
+    ),
+    "third": (
+        "Agency", "Foreign Relations Law of the United States",
+        "Law Governing Lawyers", "Property", "Property: Mortgages",
+        "Property: Servitudes", "Property: Wills and Other Donative Transfers",
+        "Restitution and Unjust Enrichment", "Suretyship and Guaranty",
+        "Torts", "Torts: Apportionment of Liability",
+        "Torts: Intentional Torts to Persons",
+        "Torts: Liability for Economic Harm",
+        "Torts: Liability for Physical and Emotional Harm",
+        "Torts: Products Liability", "Trusts", "Unfair Competition",
+    ),
+    "fourth": (
+        "Foreign Relations Law of the United States", "Property",
+    ),
+}
+_RESTATEMENT_MATCH_THRESHOLD = 95  # Minimum token_sort_ratio score of the whole subject
+
+# (status, substatus, verification_details) returned by the verifiers
+_SecondaryResult = Tuple[str, str | None, Dict[str, Any] | None]
+
+# Citation attributes read by `_extract_citation_fields`
+_CITATION_FIELDS = (
+    "source_type", "volume", "title", "section", "page",
+    "year", "edition", "series", "author",
+)
+_get_citation_fields = attrgetter(*_CITATION_FIELDS)
+_ID_TUPLE_FIELDS = ("volume", "title", "section", "year")
+
+
+@dataclass(frozen=True)
+class _LocResultColumns:
+    """LOC search results as parallel columns of cleaned field values.
+    
+    Attributes:
+        titles: Cleaned result titles.
+        partofs: Cleaned "partof" (collection/series) values.
+        dates: Cleaned result dates.
+        contributors: String contributors for each result.
+    """
+    titles: Tuple[str, ...]
+    partofs: Tuple[str, ...]
+    dates: Tuple[str, ...]
+    contributors: Tuple[Tuple[str, ...], ...]
+    
+    def __len__(self) -> int:
+        return len(self.titles)
+
+
+@dataclass(frozen=True)
+class _SecondaryPlan:
+    """A secondary citation prepared for LOC search.
+    
+    Attributes:
+        fields: Cleaned citation fields.
+        source_name: Display name of the source type.
+        queries: Search queries, ordered by specificity.
+        facet: Optional LOC facet filter (``fa`` parameter).
+        volume_re: Precompiled volume pattern for the cited volume.
+    """
+    fields: Dict[str, str]
+    source_name: str
+    queries: Tuple[str, ...]
+    facet: str | None
+    volume_re: re.Pattern[str] | None
 
 
 def _clean_value(value: Any) -> str:
@@ -65,21 +189,22 @@ def _extract_year(text: str) -> str | None:
     if not text:
         return None
     
-    import re
-    match = re.search(r"\b(17|18|19|20)\d{2}\b", text)
-    if match:
-        return match.group(0)
-    return None
+    match = _YEAR_RE.search(text)
+    return match.group(0) if match else None
 
 
-def _similarity_score(a: str, b: str) -> float:
+def _similarity_score(a: str, b: str, token_order_insensitive: bool = False) -> float:
     """Calculate similarity between two strings using partial ratio.
     
     Uses RapidFuzz's partial_ratio which handles substring matches well.
+    With `token_order_insensitive`, the score is raised to the word-level
+    token_set_ratio when that is higher, so reordered or extra words
+    ("Prosser, William L." vs. "William L. Prosser") still match.
     
     Args:
         a: First string.
         b: Second string.
+        token_order_insensitive: Also score with token_set_ratio.
         
     Returns:
         Similarity score from 0.0 to 100.0.
@@ -87,10 +212,160 @@ def _similarity_score(a: str, b: str) -> float:
     if not a or not b:
         return 0.0
     
-    a_norm = normalize_case_name_for_compare(a) or a.lower()
-    b_norm = normalize_case_name_for_compare(b) or b.lower()
+    a_norm = _normalize_for_compare(a) or a.lower()
+    b_norm = _normalize_for_compare(b) or b.lower()
+    
+    # A literal substring always scores 100 under partial_ratio
+    if a_norm in b_norm or b_norm in a_norm:
+        return 100.0
+    
+    score = fuzz.partial_ratio(a_norm, b_norm)
+    if token_order_insensitive:
+        # The compare normalization drops spaces, so tokenize the raw text
+        score = max(score, fuzz.token_set_ratio(a, b, processor=default_process))
+    return score
+
+
+def _batch_similarity_scores(
+    query: str,
+    choices: List[str],
+    token_order_insensitive: bool = False,
+) -> List[float]:
+    """Score one string against many candidates in a single RapidFuzz call.
+    
+    Equivalent to calling `_similarity_score(query, choice,
+    token_order_insensitive)` for each choice, but runs every choice that is
+    not a literal substring match through one `process.cdist` call per scorer.
+    
+    Args:
+        query: String to compare against every choice.
+        choices: Candidate strings.
+        token_order_insensitive: Also score with token_set_ratio.
+        
+    Returns:
+        Similarity scores from 0.0 to 100.0, one per choice.
+    """
+    if not query or not choices:
+        return [0.0] * len(choices)
+    
+    query_norm = _normalize_for_compare(query) or query.lower()
+    scores = [0.0] * len(choices)
+    fuzzy_indexes: List[int] = []
+    fuzzy_norms: List[str] = []
+    for idx, choice in enumerate(choices):
+        if not choice:
+            continue
+        choice_norm = _normalize_for_compare(choice) or choice.lower()
+        # A literal substring always scores 100 under partial_ratio
+        if query_norm in choice_norm or choice_norm in query_norm:
+            scores[idx] = 100.0
+        else:
+            fuzzy_indexes.append(idx)
+            fuzzy_norms.append(choice_norm)
+    
+    if fuzzy_norms:
+        row = process.cdist(
+            [query_norm], fuzzy_norms, scorer=fuzz.partial_ratio, dtype=float
+        )[0]
+        for idx, score in zip(fuzzy_indexes, row.tolist()):
+            scores[idx] = float(score)
+        
+        if token_order_insensitive:
+            token_row = process.cdist(
+                [query],
+                [choices[idx] for idx in fuzzy_indexes],
+                scorer=fuzz.token_set_ratio,
+                processor=default_process,
+                dtype=float,
+            )[0]
+            for idx, score in zip(fuzzy_indexes, token_row.tolist()):
+                scores[idx] = max(scores[idx], float(score))
+    
+    return scores
+
+
+def _volume_pattern(volume: str) -> re.Pattern[str] | None:
+    """Compile a pattern matching "volume N", "vol. N", "vol N" or "v. N".
+    
+    Args:
+        volume: Cited volume number.
+        
+    Returns:
+        Case-insensitive compiled pattern, or None if no volume was cited.
+    """
+    if not volume:
+        return None
+    return re.compile(
+        rf"\b(?:volume|vol\.?|v\.)\s*{re.escape(volume)}(?!\w)", re.IGNORECASE
+    )
+
+
+def _result_columns(results: List[Dict[str, Any]]) -> _LocResultColumns:
+    """Clean LOC results once and split them into parallel field columns.
+    
+    Args:
+        results: Search results from LOC API.
+        
+    Returns:
+        Column view of the results, one row per result.
+    """
+    rows = [
+        (
+            _clean_value(result.get("title")),
+            _clean_value(result.get("partof")),
+            _clean_value(result.get("date")),
+            tuple(
+                c for c in (result.get("contributors") or []) if isinstance(c, str)
+            ),
+        )
+        for result in results
+    ]
+    if not rows:
+        return _LocResultColumns((), (), (), ())
+    titles, partofs, dates, contributors = zip(*rows)
+    return _LocResultColumns(titles, partofs, dates, contributors)
+
+
+def _score_results(
+    columns: _LocResultColumns,
+    fields: Dict[str, str],
+) -> Tuple[List[float], List[float], List[Tuple[float, str | None]]]:
+    """Compute title, container and author similarity for every LOC result.
+    
+    Args:
+        columns: LOC search results from `_result_columns`.
+        fields: Citation fields to match against.
+        
+    Returns:
+        Tuple of (title_scores, container_scores, author_matches), each with
+        one entry per result. Author matches are (best score, contributor).
+    """
+    source_name = _SOURCE_TYPE_NAMES.get(fields.get("source_type", ""), "")
+    
+    title_scores = _batch_similarity_scores(
+        fields.get("title", ""), list(columns.titles)
+    )
+    container_scores = _batch_similarity_scores(
+        source_name, list(columns.partofs), token_order_insensitive=True
+    )
+    
+    contributors = columns.contributors
+    flat_contributors = [c for row in contributors for c in row]
+    flat_scores = iter(
+        _batch_similarity_scores(
+            fields.get("author", ""), flat_contributors, token_order_insensitive=True
+        )
+    )
+    author_matches: List[Tuple[float, str | None]] = []
+    for row in contributors:
+        best_score, best_contributor = 0.0, None
+        for contributor in row:
+            score = next(flat_scores)
+            if score > best_score:
+                best_score, best_contributor = score, contributor
+        author_matches.append((best_score, best_contributor))
     
-    return fuzz.partial_ratio(a_norm, b_norm)
+    return title_scores, container_scores, author_matches
 
 
 def _extract_citation_fields(
@@ -106,32 +381,28 @@ def _extract_citation_fields(
     Returns:
         Dictionary with cleaned citation fields.
     """
-    fields: Dict[str, str] = {}
-    
     # Try to get fields from citation object first
-    for field in ["source_type", "volume", "title", "section", "page", 
-                  "year", "edition", "series", "author"]:
-        value = getattr(cite, field, None)
-        if value:
-            fields[field] = _clean_value(value)
+    try:
+        values = _get_citation_fields(cite)
+    except AttributeError:
+        values = tuple(getattr(cite, field, None) for field in _CITATION_FIELDS)
+    fields: Dict[str, str] = {
+        field: _clean_value(value)
+        for field, value in zip(_CITATION_FIELDS, values)
+        if value
+    }
     
     # Fall back to resource_dict if needed
     if resource_dict:
         for field, value in resource_dict.items():
-            if field not in fields and value:
-                fields[field] = _clean_value(value)
+            if value:
+                fields.setdefault(field, _clean_value(value))
         
         # Extract from id_tuple if present
         id_tuple = resource_dict.get("id_tuple")
         if isinstance(id_tuple, tuple):
-            if len(id_tuple) > 0 and "volume" not in fields:
-                fields["volume"] = _clean_value(id_tuple[0])
-            if len(id_tuple) > 1 and "title" not in fields:
-                fields["title"] = _clean_value(id_tuple[1])
-            if len(id_tuple) > 2 and "section" not in fields:
-                fields["section"] = _clean_value(id_tuple[2])
-            if len(id_tuple) > 3 and "year" not in fields:
-                fields["year"] = _clean_value(id_tuple[3])
+            for field, value in zip(_ID_TUPLE_FIELDS, id_tuple):
+                fields.setdefault(field, _clean_value(value))
     
     return fields
 
@@ -196,111 +467,217 @@ def _build_search_queries(fields: Dict[str, str]) -> List[str]:
             parts.append(year)
         queries.append(" ".join(parts))
     
-    # Query 6: For A.L.R., try series-specific search
-    if source_type == "alr" and series:
+    # Query 6: For A.L.R., try series-specific search (without a title,
+    # series alone matches the whole reporter, so require the volume)
+    if source_type == "alr" and series and (title or volume):
         parts = [f"American Law Reports {series}"]
         if volume:
             parts.append(f"volume {volume}")
         queries.append(" ".join(parts))
     
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_queries = []
-    for q in queries:
-        if q and q not in seen:
-            seen.add(q)
-            unique_queries.append(q)
+    # Collapse whitespace, then remove duplicates while preserving order
+    queries = [" ".join(q.split()) for q in queries if q]
+    return list(dict.fromkeys(q for q in queries if q))
+
+
+def _get_loc_client() -> httpx.AsyncClient:
+    """Return the shared LOC client for the running event loop.
+    
+    The client is created on first use in each loop and reused by every
+    verification on that loop, so connections stay open between citations.
     
-    return unique_queries
+    Returns:
+        Pooled async HTTP client for LOC requests.
+    """
+    loop = asyncio.get_running_loop()
+    client = _loc_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=_LOC_TIMEOUT, limits=_LOC_LIMITS)
+        _loc_clients[loop] = client
+    return client
+
 
+def _get_loc_search_slots() -> asyncio.Semaphore:
+    """Return the running event loop's semaphore bounding concurrent LOC searches."""
+    loop = asyncio.get_running_loop()
+    slots = _loc_search_slots.get(loop)
+    if slots is None:
+        slots = asyncio.Semaphore(_LOC_MAX_CONCURRENT_SEARCHES)
+        _loc_search_slots[loop] = slots
+    return slots
 
-def _execute_loc_search(
+
+async def close_loc_client() -> None:
+    """Close the shared LOC client for the running event loop, if any."""
+    client = _loc_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _execute_loc_search(
+    client: httpx.AsyncClient,
     query: str,
-    attempt: int = 0,
+    facet: str | None = None,
 ) -> Tuple[List[Dict[str, Any]], str | None]:
     """Execute a search against the Library of Congress API.
     
     Includes retry logic with exponential backoff for transient failures.
+    Every attempt reuses the caller's client and its open connections.
     
     Args:
+        client: Shared async HTTP client from `_get_loc_client`.
         query: Search query string.
-        attempt: Current retry attempt number (for backoff calculation).
+        facet: Optional LOC facet filter (``fa`` parameter).
         
     Returns:
         Tuple of (results list, error message). Error message is None on success.
     """
-    params = {
-        "q": query,
-        "fo": "json",
-        "at": "results,pagination",
-    }
+    params: Dict[str, Any] = {**_LOC_BASE_PARAMS, "q": query}
+    if facet:
+        params["fa"] = facet
     
-    try:
-        with httpx.Client(timeout=_LOC_TIMEOUT) as client:
-            response = client.get(_LOC_SEARCH_URL, params=params)
+    for attempt in range(_LOC_MAX_RETRIES + 1):
+        try:
+            response = await client.get(_LOC_SEARCH_URL, params=params)
             response.raise_for_status()
             
-        data = response.json()
-        if not isinstance(data, dict):
-            logger.error("LOC API returned non-dict response for query: %s", query)
-            return [], "invalid_response_format"
-        
-        results = data.get("results", [])
-        if not isinstance(results, list):
-            logger.error("LOC API results is not a list for query: %s", query)
-            return [], "invalid_results_format"
-        
-        logger.info("LOC API returned %d results for query: %s", len(results), query)
-        return results, None
-        
-    except httpx.HTTPStatusError as exc:
-        if exc.response.status_code == 429 and attempt < _LOC_MAX_RETRIES:
-            # Rate limited - retry with exponential backoff
-            backoff = _LOC_BACKOFF_FACTOR ** attempt
-            logger.error(
-                "LOC API rate limited (429), retrying in %.1f seconds (attempt %d/%d)",
-                backoff,
-                attempt + 1,
-                _LOC_MAX_RETRIES,
-            )
-            time.sleep(backoff)
-            return _execute_loc_search(query, attempt + 1)
-        
-        logger.error("LOC API HTTP error for query '%s': %s", query, exc)
-        return [], f"http_error_{exc.response.status_code}"
-        
-    except httpx.RequestError as exc:
-        if attempt < _LOC_MAX_RETRIES:
-            backoff = _LOC_BACKOFF_FACTOR ** attempt
-            logger.error(
-                "LOC API request error, retrying in %.1f seconds (attempt %d/%d): %s",
-                backoff,
-                attempt + 1,
-                _LOC_MAX_RETRIES,
-                exc,
-            )
-            time.sleep(backoff)
-            return _execute_loc_search(query, attempt + 1)
-        
-        logger.error("LOC API request failed for query '%s': %s", query, exc)
-        return [], "request_failed"
+            data = response.json()
+            if not isinstance(data, dict):
+                logger.error("LOC API returned non-dict response for query: %s", query)
+                return [], "invalid_response_format"
+            
+            results = data.get("results", [])
+            if not isinstance(results, list):
+                logger.error("LOC API results is not a list for query: %s", query)
+                return [], "invalid_results_format"
+            
+            logger.info("LOC API returned %d results for query: %s", len(results), query)
+            return results, None
+            
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 429 and attempt < _LOC_MAX_RETRIES:
+                # Rate limited - retry with exponential backoff
+                backoff = _LOC_BACKOFF_FACTOR ** attempt
+                logger.error(
+                    "LOC API rate limited (429), retrying in %.1f seconds (attempt %d/%d)",
+                    backoff,
+                    attempt + 1,
+                    _LOC_MAX_RETRIES,
+                )
+                await asyncio.sleep(backoff)
+                continue
+            
+            logger.error("LOC API HTTP error for query '%s': %s", query, exc)
+            return [], f"http_error_{exc.response.status_code}"
+            
+        except httpx.RequestError as exc:
+            if attempt < _LOC_MAX_RETRIES:
+                backoff = _LOC_BACKOFF_FACTOR ** attempt
+                logger.error(
+                    "LOC API request error, retrying in %.1f seconds (attempt %d/%d): %s",
+                    backoff,
+                    attempt + 1,
+                    _LOC_MAX_RETRIES,
+                    exc,
+                )
+                await asyncio.sleep(backoff)
+                continue
+            
+            logger.error("LOC API request failed for query '%s': %s", query, exc)
+            return [], "request_failed"
+            
+        except Exception as exc:
+            logger.error("Unexpected error during LOC search for '%s': %s", query, exc)
+            return [], "unexpected_error"
+    
+    return [], "request_failed"
+
+
+def _remember_loc_results(key: str, results: List[Dict[str, Any]]) -> None:
+    """Store results in the in-process LRU, evicting the oldest entry when full."""
+    _loc_memory_cache[key] = results
+    _loc_memory_cache.move_to_end(key)
+    if len(_loc_memory_cache) > _LOC_MEMORY_CACHE_SIZE:
+        _loc_memory_cache.popitem(last=False)
+
+
+async def _cached_loc_search(
+    client: httpx.AsyncClient,
+    query: str,
+    facet: str | None = None,
+) -> Tuple[List[Dict[str, Any]], str | None]:
+    """Execute a LOC search, serving repeat queries from cache.
+    
+    Successful responses are cached persistently, trimmed to the fields used
+    for matching. Queries that returned nothing use a shorter TTL so they can
+    recover. Errors are never cached. Cache misses wait for one of the
+    loop's `_LOC_MAX_CONCURRENT_SEARCHES` search slots.
+    
+    Args:
+        client: Shared async HTTP client from `_get_loc_client`.
+        query: Search query string.
+        facet: Optional LOC facet filter (``fa`` parameter).
         
-    except Exception as exc:
-        logger.error("Unexpected error during LOC search for '%s': %s", query, exc)
-        return [], "unexpected_error"
+    Returns:
+        Tuple of (results list, error message). Error message is None on success.
+    """
+    key = hashlib.blake2b(f"{query}|{facet or ''}".encode()).hexdigest()
+    
+    if key in _loc_memory_cache:
+        _loc_memory_cache.move_to_end(key)
+        logger.info("LOC search served from memory cache: %s", query)
+        return _loc_memory_cache[key], None
+    
+    cached = get_cached(_LOC_CACHE_NAMESPACE, key)
+    if cached is None:
+        cached = get_cached(_LOC_EMPTY_CACHE_NAMESPACE, key, ttl=_LOC_EMPTY_CACHE_TTL)
+    if cached is not None:
+        logger.info("LOC search served from persistent cache: %s", query)
+        _remember_loc_results(key, cached)
+        return cached, None
+    
+    async with _get_loc_search_slots():
+        results, error = await _execute_loc_search(client, query, facet)
+    if error:
+        return results, error
+    
+    trimmed = [
+        {field: result[field] for field in _LOC_RESULT_FIELDS if field in result}
+        for result in results
+        if isinstance(result, dict)
+    ]
+    set_cached(
+        _LOC_CACHE_NAMESPACE if trimmed else _LOC_EMPTY_CACHE_NAMESPACE,
+        key,
+        trimmed,
+    )
+    _remember_loc_results(key, trimmed)
+    return trimmed, None
 
 
 def _match_result_to_citation(
-    result: Dict[str, Any],
+    columns: _LocResultColumns,
+    index: int,
     fields: Dict[str, str],
+    title_score: float | None = None,
+    container_score: float | None = None,
+    author_match: Tuple[float, str | None] | None = None,
+    volume_re: re.Pattern[str] | None = None,
 ) -> Tuple[bool, float, Dict[str, Any]]:
     """Determine if a LOC search result matches the citation.
     
     Performs fuzzy matching on title, container, author, and year fields.
+    Similarity scores precomputed by `_score_results` and the citation's
+    `_volume_pattern` may be passed in; any that are omitted are computed here.
     
     Args:
-        result: Search result from LOC API.
+        columns: LOC search results from `_result_columns`.
+        index: Row of the result to check.
         fields: Citation fields to match against.
+        title_score: Precomputed title similarity.
+        container_score: Precomputed source name vs. partof similarity.
+        author_match: Precomputed (best author score, matched contributor).
+        volume_re: Precompiled volume pattern for the cited volume.
         
     Returns:
         Tuple of (is_match, confidence_score, match_details).
@@ -309,10 +686,11 @@ def _match_result_to_citation(
         - match_details: Dictionary with matching field details.
     """
     # Extract fields from result
-    result_title = _clean_value(result.get("title"))
-    result_partof = _clean_value(result.get("partof"))
-    result_date = _clean_value(result.get("date"))
-    result_contributors = result.get("contributors", [])
+    result_title = columns.titles[index]
+    result_partof = columns.partofs[index]
+    result_date = columns.dates[index]
+    result_contributors = columns.contributors[index]
+    combined_result_lc = f"{result_title} {result_partof}".lower()
     
     # Extract fields from citation
     cite_title = fields.get("title", "")
@@ -322,6 +700,7 @@ def _match_result_to_citation(
     cite_volume = fields.get("volume", "")
     
     source_name = _SOURCE_TYPE_NAMES.get(cite_source_type, "")
+    source_name_lc = _SOURCE_TYPE_NAMES_LC.get(cite_source_type, "")
     
     match_details: Dict[str, Any] = {
         "matched_fields": [],
@@ -331,9 +710,9 @@ def _match_result_to_citation(
     scores: List[float] = []
     
     # Title matching
-    title_score = 0.0
     if cite_title and result_title:
-        title_score = _similarity_score(cite_title, result_title)
+        if title_score is None:
+            title_score = _similarity_score(cite_title, result_title)
         match_details["scores"]["title"] = title_score
         
         if title_score >= _TITLE_MATCH_THRESHOLD:
@@ -347,18 +726,19 @@ def _match_result_to_citation(
             )
     
     # Container/Series matching (for encyclopedias and A.L.R.)
-    container_score = 0.0
     if source_name and (result_title or result_partof):
         # Check if source name appears in result
-        combined_result = f"{result_title} {result_partof}".lower()
-        if source_name.lower() in combined_result:
+        if source_name_lc in combined_result_lc:
             container_score = 100.0
             match_details["matched_fields"].append("source")
             scores.append(1.0)
             logger.info("Source name '%s' found in result", source_name)
         else:
             # Try fuzzy match on result_partof
-            container_score = _similarity_score(source_name, result_partof)
+            if container_score is None:
+                container_score = _similarity_score(
+                    source_name, result_partof, token_order_insensitive=True
+                )
             match_details["scores"]["container"] = container_score
             
             if container_score >= _CONTAINER_MATCH_THRESHOLD:
@@ -371,35 +751,34 @@ def _match_result_to_citation(
                     container_score,
                 )
     
+    # Every match rule needs a title or source match, so skip the rest
+    if not match_details["matched_fields"]:
+        return False, 0.0, match_details
+    
     # Volume matching (if present in title or partof)
     if cite_volume:
-        volume_patterns = [
-            f"volume {cite_volume}",
-            f"vol. {cite_volume}",
-            f"v. {cite_volume}",
-        ]
-        combined_result = f"{result_title} {result_partof}".lower()
-        
-        for pattern in volume_patterns:
-            if pattern in combined_result:
-                match_details["matched_fields"].append("volume")
-                scores.append(1.0)
-                logger.info("Volume %s found in result", cite_volume)
-                break
+        if volume_re is None:
+            volume_re = _volume_pattern(cite_volume)
+        if volume_re.search(combined_result_lc):
+            match_details["matched_fields"].append("volume")
+            scores.append(1.0)
+            logger.info("Volume %s found in result", cite_volume)
     
     # Author matching (for treatises)
     if cite_author and result_contributors:
-        max_author_score = 0.0
-        matched_contributor = None
-        
-        for contributor in result_contributors:
-            if not isinstance(contributor, str):
-                continue
+        if author_match is not None:
+            max_author_score, matched_contributor = author_match
+        else:
+            max_author_score = 0.0
+            matched_contributor = None
             
-            author_score = _similarity_score(cite_author, contributor)
-            if author_score > max_author_score:
-                max_author_score = author_score
-                matched_contributor = contributor
+            for contributor in result_contributors:
+                author_score = _similarity_score(
+                    cite_author, contributor, token_order_insensitive=True
+                )
+                if author_score > max_author_score:
+                    max_author_score = author_score
+                    matched_contributor = contributor
         
         match_details["scores"]["author"] = max_author_score
         
@@ -458,15 +837,143 @@ def _match_result_to_citation(
     return is_match, confidence, match_details
 
 
-def verify_secondary_citation(
+def _match_restatement_index(fields: Dict[str, str]) -> Tuple[str, float] | None:
+    """Look up a restatement citation in the local `_RESTATEMENT_INDEX`.
+    
+    The subject is only compared against Restatements of the cited edition,
+    so a citation to a nonexistent edition never matches. The whole subject
+    must match a published one nearly exactly; a subject that merely shares
+    words with one (e.g. "Economic" vs. "Torts: Liability for Economic
+    Harm") is left to the LOC search.
+    
+    Args:
+        fields: Citation fields with "edition" and "title" (the subject).
+        
+    Returns:
+        Tuple of (canonical name, score) for a match, or None.
+    """
+    edition = fields.get("edition", "")
+    subject = fields.get("title", "")
+    subjects = _RESTATEMENT_INDEX.get(edition.lower())
+    if not subjects or not subject:
+        return None
+    
+    best = process.extractOne(
+        subject,
+        subjects,
+        scorer=fuzz.token_sort_ratio,
+        processor=default_process,
+        score_cutoff=_RESTATEMENT_MATCH_THRESHOLD,
+    )
+    if best is None:
+        return None
+    
+    matched_subject, score, _ = best
+    return f"Restatement ({edition.title()}) of {matched_subject}", score
+
+
+def _best_match_in_results(
+    results: List[Dict[str, Any]],
+    fields: Dict[str, str],
+    volume_re: re.Pattern[str] | None,
+) -> Tuple[float, Dict[str, Any]] | None:
+    """Find the best-matching LOC result for a citation.
+    
+    Stops at the first result reaching `_STRONG_MATCH_CONFIDENCE`.
+    
+    Args:
+        results: Search results from LOC API.
+        fields: Citation fields to match against.
+        volume_re: Precompiled volume pattern for the cited volume.
+        
+    Returns:
+        Tuple of (confidence, match_details) for the best match, or None.
+    """
+    best_match: Tuple[float, Dict[str, Any]] | None = None
+    
+    # Score all results at once, then check each for a match
+    columns = _result_columns(results)
+    title_scores, container_scores, author_matches = _score_results(columns, fields)
+    for result_idx in range(len(columns)):
+        is_match, confidence, match_details = _match_result_to_citation(
+            columns,
+            result_idx,
+            fields,
+            title_score=title_scores[result_idx],
+            container_score=container_scores[result_idx],
+            author_match=author_matches[result_idx],
+            volume_re=volume_re,
+        )
+        if not is_match:
+            continue
+        
+        logger.info(
+            "Found match in result %d/%d (confidence: %.2f)",
+            result_idx + 1,
+            len(columns),
+            confidence,
+        )
+        if confidence >= _STRONG_MATCH_CONFIDENCE:
+            return confidence, match_details
+        if best_match is None or confidence > best_match[0]:
+            best_match = (confidence, match_details)
+    
+    return best_match
+
+
+async def _search_for_best_match(
+    plan: _SecondaryPlan,
+    search: Callable[[str], Awaitable[Tuple[List[Dict[str, Any]], str | None]]],
+) -> Tuple[Tuple[float, Dict[str, Any]] | None, List[str]]:
+    """Run a citation's LOC searches in order of query specificity.
+    
+    Each query is only searched after the more specific ones before it
+    failed to produce a strong match.
+    
+    Args:
+        plan: Prepared citation from `_plan_secondary_verification`.
+        search: Returns the (results, error) of a LOC search for a query.
+        
+    Returns:
+        Tuple of (best match or None, per-query error messages).
+    """
+    best_match: Tuple[float, Dict[str, Any]] | None = None
+    all_errors: List[str] = []
+    
+    for query_idx, query in enumerate(plan.queries):
+        results, error = await search(query)
+        logger.info(
+            "Evaluating LOC search %d/%d: %s",
+            query_idx + 1,
+            len(plan.queries),
+            query,
+        )
+        
+        if error:
+            all_errors.append(f"Query {query_idx + 1}: {error}")
+            continue
+        
+        if not results:
+            logger.info("No results for query: %s", query)
+            continue
+        
+        match = _best_match_in_results(results, plan.fields, plan.volume_re)
+        if match and (best_match is None or match[0] > best_match[0]):
+            best_match = match
+        
+        # If we found a good match, stop trying other queries
+        if best_match and best_match[0] >= _STRONG_MATCH_CONFIDENCE:
+            break
+    
+    return best_match, all_errors
+
+
+def _plan_secondary_verification(
     cite: Any,
     normalized_key: str | None,
     resource_dict: Dict[str, Any] | None,
-) -> Tuple[str, str | None, Dict[str, Any] | None]:
-    """Verify a secondary source citation using Library of Congress API.
-    
-    Searches the LOC catalog for records matching the citation and performs
-    fuzzy matching to determine if a valid match exists.
+) -> _SecondaryResult | _SecondaryPlan:
+    """Prepare a secondary citation for LOC search.
     
     Args:
         cite: Citation object (SecondaryCitation or similar).
@@ -474,10 +981,8 @@ def verify_secondary_citation(
         resource_dict: Resource metadata dictionary.
         
     Returns:
-        Tuple of (status, substatus, verification_details) where:
-        - status: "verified", "warning", "no_match", or "error"
-        - substatus: Additional status information
-        - verification_details: Dictionary with verification metadata
+        The final verification result when no LOC search is needed (local
+        index hit or insufficient data), otherwise the search plan.
     """
     # Extract citation fields
     fields = _extract_citation_fields(cite, resource_dict)
@@ -491,6 +996,43 @@ def verify_secondary_citation(
         normalized_key or fields.get("title", "untitled"),
     )
     
+    # Known Restatements verify against the local index without a LOC search
+    if source_type == "restatement":
+        indexed = _match_restatement_index(fields)
+        if indexed:
+            restatement_name, score = indexed
+            logger.info(
+                "Restatement matched local index: %s (score: %.1f)",
+                restatement_name,
+                score,
+            )
+            return (
+                "verified",
+                None,
+                {
+                    "source": "local_index",
+                    "confidence": round(score / 100.0, 3),
+                    "matched_fields": ["edition", "title"],
+                    "restatement": restatement_name,
+                },
+            )
+    
+    # Without a title, only an A.L.R. series and volume can identify the
+    # source; anything else would just pull unrelated LOC records
+    has_alr_locator = (
+        source_type == "alr" and fields.get("series") and fields.get("volume")
+    )
+    if not fields.get("title") and not has_alr_locator:
+        logger.info("Skipping LOC search for %s citation without a title", source_name)
+        return (
+            "error",
+            "insufficient_citation_data",
+            {
+                "source": "library_of_congress",
+                "available_fields": list(fields.keys()),
+            },
+        )
+    
     # Build search queries
     queries = _build_search_queries(fields)
     
@@ -513,52 +1055,32 @@ def verify_secondary_citation(
         queries[0] if queries else "none",
     )
     
-    # Try each query until we find a match
-    best_match: Tuple[Dict[str, Any], float, Dict[str, Any]] | None = None
-    all_errors: List[str] = []
+    return _SecondaryPlan(
+        fields=fields,
+        source_name=source_name,
+        queries=tuple(queries),
+        facet=_LOC_FORMAT_FACETS.get(source_type),
+        volume_re=_volume_pattern(fields.get("volume", "")),
+    )
+
+
+def _secondary_result(
+    plan: _SecondaryPlan,
+    best_match: Tuple[float, Dict[str, Any]] | None,
+    all_errors: List[str],
+) -> _SecondaryResult:
+    """Turn the best LOC match for a citation into a verification result.
     
-    for query_idx, query in enumerate(queries):
-        logger.info(
-            "Executing LOC search %d/%d: %s",
-            query_idx + 1,
-            len(queries),
-            query,
-        )
-        
-        results, error = _execute_loc_search(query)
-        
-        if error:
-            all_errors.append(f"Query {query_idx + 1}: {error}")
-            continue
-        
-        if not results:
-            logger.info("No results for query: %s", query)
-            continue
-        
-        # Check each result for a match
-        for result_idx, result in enumerate(results):
-            is_match, confidence, match_details = _match_result_to_citation(
-                result, fields
-            )
-            
-            if is_match:
-                logger.info(
-                    "Found match in result %d/%d (confidence: %.2f)",
-                    result_idx + 1,
-                    len(results),
-                    confidence,
-                )
-                
-                if best_match is None or confidence > best_match[1]:
-                    best_match = (result, confidence, match_details)
-                
-                # If we found a high-confidence match, stop searching
-                if confidence >= 0.85:
-                    break
+    Args:
+        plan: Prepared citation from `_plan_secondary_verification`.
+        best_match: Tuple of (confidence, match_details), or None.
+        all_errors: Per-query error messages.
         
-        # If we found a good match, stop trying other queries
-        if best_match and best_match[1] >= 0.85:
-            break
+    Returns:
+        Tuple of (status, substatus, verification_details).
+    """
+    queries = plan.queries
+    source_name = plan.source_name
     
     # Determine final status based on best match
     if best_match is None:
@@ -586,7 +1108,7 @@ def verify_secondary_citation(
             },
         )
     
-    result, confidence, match_details = best_match
+    confidence, match_details = best_match
     
     # High confidence = verified
     if confidence >= 0.80:
@@ -637,4 +1159,115 @@ def verify_secondary_citation(
     )
 
 
-__all__ = ["verify_secondary_citation"]
+async def verify_secondary_citations_batch(
+    items: List[Tuple[Any, str | None, Dict[str, Any] | None]],
+) -> List[_SecondaryResult]:
+    """Verify many secondary source citations with shared LOC searches.
+    
+    Citations from one document often produce identical queries (same
+    source name, title and facet). Each distinct query is searched at most
+    once over the loop's shared client, and its results are matched against
+    every citation that asks for it. Citations are evaluated concurrently,
+    each trying its queries one at a time, and the number of LOC requests
+    in flight is bounded by `_LOC_MAX_CONCURRENT_SEARCHES`.
+    
+    Args:
+        items: List of (cite, normalized_key, resource_dict) tuples.
+        
+    Returns:
+        Verification results, one (status, substatus, verification_details)
+        tuple per item, in input order.
+    """
+    outcomes = [_plan_secondary_verification(*item) for item in items]
+    plans = [outcome for outcome in outcomes if isinstance(outcome, _SecondaryPlan)]
+    if not plans:
+        return list(outcomes)
+    
+    client = _get_loc_client()
+    searches: Dict[Tuple[str, str | None], asyncio.Task] = {}
+    
+    logger.info("Running LOC searches for %d secondary citations", len(plans))
+    
+    async def _resolve(plan: _SecondaryPlan) -> _SecondaryResult:
+        def _search(query: str) -> Awaitable[Tuple[List[Dict[str, Any]], str | None]]:
+            # Citations asking for the same query share one search
+            key = (query, plan.facet)
+            if key not in searches:
+                searches[key] = asyncio.create_task(
+                    _cached_loc_search(client, query, plan.facet)
+                )
+            return searches[key]
+        
+        best_match, all_errors = await _search_for_best_match(plan, _search)
+        return _secondary_result(plan, best_match, all_errors)
+    
+    try:
+        resolved = iter(await asyncio.gather(*(_resolve(plan) for plan in plans)))
+    finally:
+        for search in searches.values():
+            search.cancel()
+        await asyncio.gather(*searches.values(), return_exceptions=True)
+    
+    return [
+        next(resolved) if isinstance(outcome, _SecondaryPlan) else outcome
+        for outcome in outcomes
+    ]
+
+
+async def verify_secondary_citation_async(
+    cite: Any,
+    normalized_key: str | None,
+    resource_dict: Dict[str, Any] | None,
+) -> _SecondaryResult:
+    """Verify a secondary source citation using Library of Congress API.
+    
+    Searches the LOC catalog for records matching the citation and performs
+    fuzzy matching to determine if a valid match exists. Queries are tried in
+    order of specificity over the loop's shared client, stopping at the first
+    strong match.
+    
+    Args:
+        cite: Citation object (SecondaryCitation or similar).
+        normalized_key: Normalized citation string.
+        resource_dict: Resource metadata dictionary.
+        
+    Returns:
+        Tuple of (status, substatus, verification_details) where:
+        - status: "verified", "warning", "no_match", or "error"
+        - substatus: Additional status information
+        - verification_details: Dictionary with verification metadata
+    """
+    results = await verify_secondary_citations_batch(
+        [(cite, normalized_key, resource_dict)]
+    )
+    return results[0]
+
+
+def verify_secondary_citation(
+    cite: Any,
+    normalized_key: str | None,
+    resource_dict: Dict[str, Any] | None,
+) -> Tuple[str, str | None, Dict[str, Any] | None]:
+    """Synchronous wrapper around `verify_secondary_citation_async`.
+    
+    Must not be called from a running event loop; async callers should await
+    `verify_secondary_citation_async` directly.
+    """
+    async def _verify() -> Tuple[str, str | None, Dict[str, Any] | None]:
+        try:
+            return await verify_secondary_citation_async(
+                cite, normalized_key, resource_dict
+            )
+        finally:
+            # asyncio.run closes its loop on return, so release the client first
+            await close_loc_client()
+    
+    return asyncio.run(_verify())
+
+
+__all__ = [
+    "close_loc_client",
+    "verify_secondary_citation",
+    "verify_secondary_citation_async",
+    "verify_secondary_citations_batch",
+]
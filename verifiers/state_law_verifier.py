@@ -1,18 +1,31 @@
+import asyncio
 import json
 import os
-from typing import Any, Dict, Tuple
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
 
 from eyecite.models import FullCitation, FullLawCitation
-from openai import OpenAI
-from openai.types import ResponsesModel
+from openai import AsyncOpenAI, OpenAI
+from reporters_db import LAWS
 
 from utils.cleaner import clean_str
 from utils.logger import get_logger
+from utils.verification_cache import get_cached, make_cache_key, set_cached
 
 logger = get_logger()
 
 OPENAI_API_KEY = "OPENAI_API_KEY"
 
+# Clients are reused so their connection pools stay warm between citations.
+# AsyncOpenAI connections are bound to an event loop, so keep one per loop.
+_openai_client: OpenAI | None = None
+_async_openai_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI] = (
+    weakref.WeakKeyDictionary()
+)
+
 PROMPT = """
 You are an expert in legal research, specifically in the context of state laws, codes, and regulations. You are tasked with
 verifying the veracity of citations in legal documents. In this context, you should take the utmost care to ensure that the
@@ -34,12 +47,111 @@ that different states arrange their laws in different formats; therefore, there
 field. Your primary goal is to verify whether the citation you are provided corresponds to an actual, in-effect state law citation.\n\n
 """
 
+BATCH_PROMPT_SUFFIX = """
+You will be given a numbered list of citations rather than a single citation. Verify each citation independently, and respond with a
+JSON object whose "results" field is an array containing exactly one JSON object per citation, in the same order as the list, each in
+the format above plus an "index" field holding the citation's number in the list. Do not return any text or other characters apart
+from the JSON object.\n\n
+"""
+
+_CHUNK_PROMPT = PROMPT + BATCH_PROMPT_SUFFIX
+
+# Output token caps. These include reasoning and web search tokens, not just
+# the JSON answer, so they bound runaway browsing without truncating replies.
+STATE_LAW_MAX_OUTPUT_TOKENS = 2048
+STATE_LAW_MAX_OUTPUT_TOKENS_PER_EXTRA_CITATION = 512
+
+# Model used for state law verification; override with the STATE_LAW_MODEL env var
+STATE_LAW_MODEL = os.getenv("STATE_LAW_MODEL", "gpt-5-mini")
+
+# Structured output schemas, so responses are always parseable JSON
+_RESULT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "status": {"type": "string", "enum": ["verified", "warning", "no_match", "error"]},
+        "citation": {"type": ["string", "null"]},
+        "confidence": {"type": "number"},
+    },
+    "required": ["status", "citation", "confidence"],
+    "additionalProperties": False,
+}
+_RESULT_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "name": "state_law_verification",
+    "schema": _RESULT_SCHEMA,
+    "strict": True,
+}
+# Chunk results echo the citation's list number, so each result can be
+# matched to its citation rather than trusting the array order
+_CHUNK_ITEM_SCHEMA: Dict[str, Any] = {
+    **_RESULT_SCHEMA,
+    "properties": {"index": {"type": "integer"}, **_RESULT_SCHEMA["properties"]},
+    "required": ["index", *_RESULT_SCHEMA["required"]],
+}
+_CHUNK_RESULT_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "name": "state_law_verifications",
+    "schema": {
+        "type": "object",
+        "properties": {"results": {"type": "array", "items": _CHUNK_ITEM_SCHEMA}},
+        "required": ["results"],
+        "additionalProperties": False,
+    },
+    "strict": True,
+}
+
+# Citations sent per request by verify_state_law_citations_batch; larger
+# batches save round-trips but degrade accuracy for items mid-list
+STATE_LAW_BATCH_SIZE = 10
+
+# Maximum concurrent OpenAI requests from verify_state_law_citations_batch_async
+STATE_LAW_CONCURRENCY = 20
+
+# Retries per request on rate limits, timeouts and server errors; the OpenAI
+# SDK backs off exponentially with jitter and honours Retry-After
+STATE_LAW_MAX_RETRIES = 5
+
+# OpenAI Batch API settings for verify_state_law_citations_via_batch
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 30.0
+_BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Verification results keyed by model and Bluebook citation, so a statute
+# cited repeatedly is only sent to OpenAI once and changing STATE_LAW_MODEL
+# never serves another model's answers: an in-process LRU in front of the
+# persistent verification cache. Errors are not cached.
+_CACHE_NAMESPACE = "state_law"
+_RESULT_CACHE_SIZE = 4096
+_CACHEABLE_STATUSES = {"verified", "warning", "no_match"}
+_result_cache: OrderedDict[str, Tuple[str, str | None, Dict[str, Any] | None]] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# State codes, consolidated laws and administrative codes, i.e. the kinds of
+# law ALLOWED_DOMAINS publish. Citations whose reporter is only a session law
+# service, register, docket or federal source can be rejected without a search.
+_SEARCHABLE_LAW_CITE_TYPES = frozenset({"leg_statute", "leg_act", "admin_compilation"})
+_SEARCHABLE_STATE_LAW_REPORTERS = frozenset(
+    short_name
+    for short_name, entries in LAWS.items()
+    for entry in entries
+    if entry.get("cite_type") in _SEARCHABLE_LAW_CITE_TYPES and entry.get("jurisdiction") != "United States"
+)
+
 ALLOWED_DOMAINS = [
     "law.justia.com",
     "law.cornell.edu",
     "codes.findlaw.com"
 ]
 
+# Position of each law citation field within a resource's ``id_tuple``.
+_ID_TUPLE_IDX = {
+    "code": 0,
+    "reporter": 0,
+    "section": 1,
+    "page": 1,
+    "year": 2,
+}
+
 def _get_law_group(
     cite: FullCitation | None,
     resource_dict: Dict[str, Any] | None,
@@ -47,12 +159,10 @@ def _get_law_group(
 ) -> str | None:
     if isinstance(cite, FullCitation):
         groups = getattr(cite, "groups", {}) or {}
-        if key in groups:
-            value = (groups.get(key))
-            if value:
-                return value
+        value = groups.get(key)
+        if value:
+            return value
 
-    if isinstance(cite, FullCitation):
         direct_value = clean_str(getattr(cite, key, None))
         if direct_value is not None:
             return direct_value
@@ -60,14 +170,7 @@ def _get_law_group(
     resource_dict = resource_dict or {}
     id_tuple = resource_dict.get("id_tuple")
     if isinstance(id_tuple, tuple):
-        mapping = {
-            "code": 0,
-            "reporter": 0,
-            "section": 1,
-            "page": 1,
-            "year": 2,
-        }
-        idx = mapping.get(key)
+        idx = _ID_TUPLE_IDX.get(key)
         if idx is not None and len(id_tuple) > idx:
             value = clean_str(id_tuple[idx])
             if value:
@@ -76,38 +179,61 @@ def _get_law_group(
     return None
 
 def _get_openai_client() -> OpenAI | None:
-    if OPENAI_API_KEY is None or OPENAI_API_KEY == "":
+    global _openai_client
+    if _openai_client is not None:
+        return _openai_client
+    open_api_key = os.getenv(OPENAI_API_KEY, "")
+    if not open_api_key:
         logger.error("OPENAI_API_KEY is not set.")
         return None
     try:
-        open_api_key = os.getenv(OPENAI_API_KEY, "")
-        client = OpenAI(api_key=open_api_key)
+        _openai_client = OpenAI(api_key=open_api_key, max_retries=STATE_LAW_MAX_RETRIES)
+        return _openai_client
+    except Exception as e:
+        logger.error(f"Error initializing OpenAI client: {e}")
+        return None
+
+def _get_async_openai_client() -> AsyncOpenAI | None:
+    """Return the AsyncOpenAI client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _async_openai_clients.get(loop)
+    if client is not None and not client.is_closed():
+        return client
+    open_api_key = os.getenv(OPENAI_API_KEY, "")
+    if not open_api_key:
+        logger.error("OPENAI_API_KEY is not set.")
+        return None
+    try:
+        client = AsyncOpenAI(api_key=open_api_key, max_retries=STATE_LAW_MAX_RETRIES)
+        _async_openai_clients[loop] = client
         return client
     except Exception as e:
         logger.error(f"Error initializing OpenAI client: {e}")
         return None
 
-def _clean_json_response(response_text: str) -> str:
-    start_idx = response_text.find("{")
-    end_idx = response_text.rfind("}") + 1
-    if start_idx != -1 and end_idx != -1:
-        return response_text[start_idx:end_idx]
-    return response_text
+async def close_async_openai_client() -> None:
+    """Close the running event loop's AsyncOpenAI client, if one was created."""
+    client = _async_openai_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
 
-def verify_state_law_citation(
+def _build_bluebook_citation(
     primary_full: FullCitation | None,
-    normalized_key: str | None,
     resource_dict: Dict[str, Any] | None,
-    fallback_citation: str | None = None,
-) -> Tuple[str, str | None, Dict[str, Any] | None]:
-
+) -> Tuple[str | None, Tuple[str, str | None, Dict[str, Any] | None] | None]:
+    """Return (bluebook_citation, None), or (None, error_result) if the citation is unusable."""
     if not isinstance(primary_full, FullLawCitation):
         logger.error("Primary full citation is not a FullLawCitation.")
-        return "error", "unsupported_citation_type", None
+        return None, ("error", "unsupported_citation_type", None)
+
+    editions = primary_full.all_editions
+    if editions and not any(edition.short_name in _SEARCHABLE_STATE_LAW_REPORTERS for edition in editions):
+        logger.info("State law reporter is not a searchable state code: %s", primary_full.groups.get("reporter"))
+        return None, ("no_match", "unsupported_state_law_source", None)
 
     reporter = _get_law_group(primary_full, resource_dict, "reporter")
     if not reporter:
-        return (
+        return None, (
             "error",
             "missing_reporter",
             None
@@ -116,7 +242,7 @@ def verify_state_law_citation(
 
     section = _get_law_group(primary_full, resource_dict, "section")
     if not section:
-        return (
+        return None, (
             "error",
             "missing_section",
             None
@@ -129,64 +255,497 @@ def verify_state_law_citation(
     bluebook_citation = f"{reporter} § {section}"
     if year:
         bluebook_citation += f" ({year})"
+    return bluebook_citation, None
+
+def _response_params(
+    instructions: str,
+    input: str,
+    text_format: Dict[str, Any],
+    max_output_tokens: int = STATE_LAW_MAX_OUTPUT_TOKENS,
+) -> Dict[str, Any]:
+    """Responses API arguments, shared by direct calls and Batch API request bodies."""
+    # The static prompt goes in instructions so the request prefix is identical
+    # across calls and eligible for OpenAI prompt caching.
+    return {
+        "model": STATE_LAW_MODEL,
+        "instructions": instructions,
+        "input": input,
+        "tools": [{
+            "type": "web_search",
+            "filters": { "allowed_domains": ALLOWED_DOMAINS }
+        }],
+        "tool_choice": "auto",
+        "text": { "verbosity": "low", "format": text_format },
+        "reasoning": { "effort": "low"},
+        "max_output_tokens": max_output_tokens,
+    }
+
+def _extract_output_text(response: Any) -> str | None:
+    if getattr(response, "status", None) == "incomplete":
+        logger.warning("State law verification response incomplete: %s", getattr(response, "incomplete_details", None))
+        return None
+    output_message = next((item for item in response.output if item.type == "message"), None)
+    if output_message is None:
+        return None
+    return next(
+        (content_item.text for content_item in (output_message.content or []) if content_item.type == "output_text"),
+        None,
+    )
+
+def _extract_output_text_from_body(body: Dict[str, Any]) -> str | None:
+    """Same as _extract_output_text, for a raw response body from a Batch API output file."""
+    if body.get("status") == "incomplete":
+        logger.warning("State law verification response incomplete: %s", body.get("incomplete_details"))
+        return None
+    output_message = next((item for item in body.get("output") or [] if item.get("type") == "message"), None)
+    if output_message is None:
+        return None
+    return next(
+        (
+            content_item.get("text")
+            for content_item in output_message.get("content") or []
+            if content_item.get("type") == "output_text"
+        ),
+        None,
+    )
+
+_NULLS = frozenset({"null", "none", ""})
+
+def _norm(value: Any) -> Any:
+    if isinstance(value, str) and value.strip().lower() in _NULLS:
+        return None
+    return value
+
+def _result_from_data(data: Any) -> Tuple[str, str | None, Dict[str, Any] | None]:
+    if not isinstance(data, dict):
+        data = {}
+    status = _norm(data.get("status")) or "error"
+    citation = _norm(data.get("citation")) or None
+    confidence = _norm(data.get("confidence")) or None
+
+    logger.info(
+        "Parsed state law citation verification: status=%s, citation=%s, confidence=%s",
+        status,
+        citation,
+        confidence,
+    )
+
+    return status, f"closest_match: {citation}, confidence: {confidence}", None
+
+def _result_from_candidate(candidate: Any) -> Tuple[str, str | None, Dict[str, Any] | None]:
+    logger.info("OpenAI response for state law citation verification: %s", candidate)
+    data = {}
+    if isinstance(candidate, dict):
+        data = candidate
+    elif isinstance(candidate, str):
+        try:
+            data = json.loads(candidate)
+        except Exception as e:
+            logger.error(f"Error parsing JSON response: {e}")
+            return "error", "state_law_search_failed", None
+
+    logger.info("Parsed OpenAI response data: %s", data)
+    return _result_from_data(data)
+
+def _cache_key(bluebook_citation: str) -> str | None:
+    return make_cache_key(STATE_LAW_MODEL, bluebook_citation)
+
+def _store_in_memory(
+    key: str,
+    result: Tuple[str, str | None, Dict[str, Any] | None],
+) -> None:
+    with _result_cache_lock:
+        _result_cache[key] = result
+        _result_cache.move_to_end(key)
+        if len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+def _cached_result(bluebook_citation: str) -> Tuple[str, str | None, Dict[str, Any] | None] | None:
+    key = _cache_key(bluebook_citation)
+    if key is None:
+        return None
+    with _result_cache_lock:
+        result = _result_cache.get(key)
+        if result is not None:
+            _result_cache.move_to_end(key)
+    if result is not None:
+        logger.info("State law verification served from cache: %s", bluebook_citation)
+        return result
+
+    stored = get_cached(_CACHE_NAMESPACE, key)
+    if isinstance(stored, list) and len(stored) == 3 and stored[0] in _CACHEABLE_STATUSES:
+        result = (stored[0], stored[1], stored[2])
+        _store_in_memory(key, result)
+        logger.info("State law verification served from persistent cache: %s", bluebook_citation)
+        return result
+    return None
+
+def _remember_result(
+    bluebook_citation: str,
+    result: Tuple[str, str | None, Dict[str, Any] | None],
+) -> Tuple[str, str | None, Dict[str, Any] | None]:
+    key = _cache_key(bluebook_citation)
+    if key is not None and result[0] in _CACHEABLE_STATUSES:
+        _store_in_memory(key, result)
+        set_cached(_CACHE_NAMESPACE, key, list(result))
+    return result
+
+def _single_params(bluebook_citation: str) -> Dict[str, Any]:
+    return _response_params(PROMPT, f"Citation to verify: {bluebook_citation}", _RESULT_FORMAT)
+
+def _chunk_params(bluebook_citations: List[str]) -> Dict[str, Any]:
+    numbered = "\n".join(f"{i}. {citation}" for i, citation in enumerate(bluebook_citations, start=1))
+    max_output_tokens = (
+        STATE_LAW_MAX_OUTPUT_TOKENS
+        + STATE_LAW_MAX_OUTPUT_TOKENS_PER_EXTRA_CITATION * (len(bluebook_citations) - 1)
+    )
+    return _response_params(
+        _CHUNK_PROMPT,
+        f"Citations to verify:\n{numbered}",
+        _CHUNK_RESULT_FORMAT,
+        max_output_tokens,
+    )
+
+def _verify_bluebook_citation(
+    client: OpenAI,
+    bluebook_citation: str,
+) -> Tuple[str, str | None, Dict[str, Any] | None]:
+    try:
+        response = client.responses.create(**_single_params(bluebook_citation))
+        return _result_from_candidate(_extract_output_text(response))
+
+    except Exception as e:
+        logger.error(f"Error during state law citation verification: {e}")
+        return "error", "state_law_search_failed", None
+
+async def _verify_bluebook_citation_async(
+    client: AsyncOpenAI,
+    bluebook_citation: str,
+) -> Tuple[str, str | None, Dict[str, Any] | None]:
+    try:
+        response = await client.responses.create(**_single_params(bluebook_citation))
+        return _result_from_candidate(_extract_output_text(response))
+
+    except Exception as e:
+        logger.error(f"Error during state law citation verification: {e}")
+        return "error", "state_law_search_failed", None
+
+def _verify_bluebook_citations_chunk(
+    client: OpenAI,
+    bluebook_citations: List[str],
+) -> List[Tuple[str, str | None, Dict[str, Any] | None]] | None:
+    """Verify several citations in one request; None if the reply cannot be split per citation."""
+    try:
+        response = client.responses.create(**_chunk_params(bluebook_citations))
+        candidate = _extract_output_text(response)
+    except Exception as e:
+        logger.error(f"Error during batched state law citation verification: {e}")
+        return None
+    return _results_from_chunk_candidate(candidate, len(bluebook_citations))
+
+async def _verify_bluebook_citations_chunk_async(
+    client: AsyncOpenAI,
+    bluebook_citations: List[str],
+) -> List[Tuple[str, str | None, Dict[str, Any] | None]] | None:
+    """Async form of _verify_bluebook_citations_chunk."""
+    try:
+        response = await client.responses.create(**_chunk_params(bluebook_citations))
+        candidate = _extract_output_text(response)
+    except Exception as e:
+        logger.error(f"Error during batched state law citation verification: {e}")
+        return None
+    return _results_from_chunk_candidate(candidate, len(bluebook_citations))
+
+def _results_from_chunk_candidate(
+    candidate: Any,
+    expected: int,
+) -> List[Tuple[str, str | None, Dict[str, Any] | None]] | None:
+    logger.info("OpenAI response for batched state law citation verification: %s", candidate)
+    if not isinstance(candidate, str):
+        return None
+    try:
+        data = json.loads(candidate).get("results")
+    except Exception as e:
+        logger.error(f"Error parsing batched JSON response: {e}")
+        return None
+
+    if not isinstance(data, list) or len(data) != expected:
+        logger.error(
+            f"Batched state law response had {len(data) if isinstance(data, list) else 'no'} "
+            f"results for {expected} citations; verifying individually."
+        )
+        return None
+
+    by_index = {item.get("index"): item for item in data if isinstance(item, dict)}
+    if set(by_index) != set(range(1, expected + 1)):
+        logger.error(
+            f"Batched state law response indexes {sorted(map(str, by_index))} do not match "
+            f"citations 1-{expected}; verifying individually."
+        )
+        return None
+    return [_result_from_data(by_index[i]) for i in range(1, expected + 1)]
+
+def verify_state_law_citation(
+    primary_full: FullCitation | None,
+    normalized_key: str | None,
+    resource_dict: Dict[str, Any] | None,
+    fallback_citation: str | None = None,
+) -> Tuple[str, str | None, Dict[str, Any] | None]:
+
+    bluebook_citation, error = _build_bluebook_citation(primary_full, resource_dict)
+    if error is not None:
+        return error
+    cached = _cached_result(bluebook_citation)
+    if cached is not None:
+        return cached
 
     try:
         client = _get_openai_client()
         if client is None:
             return "error", "openai_client_init_failed", None
+    except Exception as e:
+        logger.error(f"Error during state law citation verification: {e}")
+        return "error", "state_law_search_failed", None
+
+    return _remember_result(bluebook_citation, _verify_bluebook_citation(client, bluebook_citation))
+
+async def verify_state_law_citation_async(
+    primary_full: FullCitation | None,
+    normalized_key: str | None,
+    resource_dict: Dict[str, Any] | None,
+    fallback_citation: str | None = None,
+) -> Tuple[str, str | None, Dict[str, Any] | None]:
+    """Async form of verify_state_law_citation, for fanning out with asyncio.gather."""
+    bluebook_citation, error = _build_bluebook_citation(primary_full, resource_dict)
+    if error is not None:
+        return error
+    cached = _cached_result(bluebook_citation)
+    if cached is not None:
+        return cached
 
-        input = PROMPT + f"Citation to verify: {bluebook_citation}"
-        model: ResponsesModel = "gpt-5"
-
-        response = client.responses.create(
-            model = model,
-            input = input,
-            tools = [{
-                "type": "web_search",
-                "filters": { "allowed_domains": ALLOWED_DOMAINS }
-            }],
-            tool_choice = "auto",
-            text = { "verbosity": "low" },
-            reasoning = { "effort": "low"}
+    client = _get_async_openai_client()
+    if client is None:
+        return "error", "openai_client_init_failed", None
+
+    return _remember_result(bluebook_citation, await _verify_bluebook_citation_async(client, bluebook_citation))
+
+def _prepare_items(
+    items: List[Tuple[FullCitation | None, str | None, Dict[str, Any] | None, str | None]],
+) -> Tuple[List[Tuple[str, str | None, Dict[str, Any] | None] | None], Dict[str, List[int]]]:
+    """Build Bluebook citations for items.
+
+    Returns (results, pending): results has invalid and cached items filled
+    in; pending maps each citation still to send to the indexes of the items
+    citing it, so a repeated citation is sent once.
+    """
+    results: List[Tuple[str, str | None, Dict[str, Any] | None] | None] = [None] * len(items)
+    pending: Dict[str, List[int]] = {}
+    for idx, (primary_full, _normalized_key, resource_dict, _fallback) in enumerate(items):
+        bluebook_citation, error = _build_bluebook_citation(primary_full, resource_dict)
+        if error is not None:
+            results[idx] = error
+            continue
+        cached = _cached_result(bluebook_citation)
+        if cached is not None:
+            results[idx] = cached
+        else:
+            pending.setdefault(bluebook_citation, []).append(idx)
+    return results, pending
+
+def verify_state_law_citations_batch(
+    items: List[Tuple[FullCitation | None, str | None, Dict[str, Any] | None, str | None]],
+    batch_size: int = STATE_LAW_BATCH_SIZE,
+) -> List[Tuple[str, str | None, Dict[str, Any] | None]]:
+    """Verify many state law citations, sending up to batch_size per request.
+
+    Each request carries the prompt once plus a numbered list of citations.
+    If a reply cannot be matched one-to-one with its citations, that chunk
+    falls back to one request per citation.
+
+    Args:
+        items: List of (primary_full, normalized_key, resource_dict, fallback_citation) tuples.
+        batch_size: Maximum citations per request.
+
+    Returns:
+        Verification results, one (status, substatus, verification_details)
+        tuple per item, in input order.
+    """
+    results, pending = _prepare_items(items)
+    citations = list(pending)
+
+    if citations:
+        client = _get_openai_client()
+        if client is None:
+            for indexes in pending.values():
+                for idx in indexes:
+                    results[idx] = ("error", "openai_client_init_failed", None)
+            citations = []
+
+    for start in range(0, len(citations), max(batch_size, 1)):
+        chunk = citations[start:start + max(batch_size, 1)]
+        chunk_results = None
+        if len(chunk) > 1:
+            chunk_results = _verify_bluebook_citations_chunk(client, chunk)
+        if chunk_results is None:
+            chunk_results = [_verify_bluebook_citation(client, citation) for citation in chunk]
+        for citation, result in zip(chunk, chunk_results):
+            result = _remember_result(citation, result)
+            for idx in pending[citation]:
+                results[idx] = result
+
+    return results
+
+async def verify_state_law_citations_batch_async(
+    items: List[Tuple[FullCitation | None, str | None, Dict[str, Any] | None, str | None]],
+    batch_size: int = STATE_LAW_BATCH_SIZE,
+    concurrency: int = STATE_LAW_CONCURRENCY,
+) -> List[Tuple[str, str | None, Dict[str, Any] | None]]:
+    """Async form of verify_state_law_citations_batch.
+
+    All chunks (and any per-citation fallbacks) are sent concurrently, with
+    at most concurrency requests in flight to stay within rate limits.
+
+    Args:
+        items: List of (primary_full, normalized_key, resource_dict, fallback_citation) tuples.
+        batch_size: Maximum citations per request.
+        concurrency: Maximum concurrent OpenAI requests.
+
+    Returns:
+        Verification results, one (status, substatus, verification_details)
+        tuple per item, in input order.
+    """
+    results, pending = _prepare_items(items)
+    if not pending:
+        return results
+
+    client = _get_async_openai_client()
+    if client is None:
+        for indexes in pending.values():
+            for idx in indexes:
+                results[idx] = ("error", "openai_client_init_failed", None)
+        return results
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def _verify_one(bluebook_citation: str) -> Tuple[str, str | None, Dict[str, Any] | None]:
+        async with semaphore:
+            return await _verify_bluebook_citation_async(client, bluebook_citation)
+
+    async def _verify_chunk(chunk: List[str]) -> None:
+        chunk_results = None
+        if len(chunk) > 1:
+            async with semaphore:
+                chunk_results = await _verify_bluebook_citations_chunk_async(client, chunk)
+        if chunk_results is None:
+            chunk_results = await asyncio.gather(*(_verify_one(citation) for citation in chunk))
+        for citation, result in zip(chunk, chunk_results):
+            result = _remember_result(citation, result)
+            for idx in pending[citation]:
+                results[idx] = result
+
+    citations = list(pending)
+    step = max(batch_size, 1)
+    await asyncio.gather(*(_verify_chunk(citations[start:start + step]) for start in range(0, len(citations), step)))
+
+    return results
+
+def verify_state_law_citations_via_batch(
+    items: List[Tuple[FullCitation | None, str | None, Dict[str, Any] | None, str | None]],
+    poll_interval: float = BATCH_POLL_INTERVAL,
+    timeout: float | None = None,
+) -> List[Tuple[str, str | None, Dict[str, Any] | None]]:
+    """Verify state law citations through the OpenAI Batch API.
+
+    For non-interactive bulk runs: requests are billed at the batch discount
+    and count against the separate batch rate limits, but results may take
+    up to BATCH_COMPLETION_WINDOW. Each citation becomes one /v1/responses
+    request with the same arguments as verify_state_law_citation. This call
+    blocks, polling every poll_interval seconds, until the batch finishes or
+    timeout seconds elapse (the batch is then cancelled).
+
+    Args:
+        items: List of (primary_full, normalized_key, resource_dict, fallback_citation) tuples.
+        poll_interval: Seconds between batch status checks.
+        timeout: Maximum seconds to wait, or None to wait for the completion window.
+
+    Returns:
+        Verification results, one (status, substatus, verification_details)
+        tuple per item, in input order.
+    """
+    results, to_send = _prepare_items(items)
+    if not to_send:
+        return results
+
+    client = _get_openai_client()
+    if client is None:
+        for indexes in to_send.values():
+            for idx in indexes:
+                results[idx] = ("error", "openai_client_init_failed", None)
+        return results
+
+    pending: Dict[str, Tuple[List[int], str]] = {}
+    lines: List[str] = []
+    for bluebook_citation, indexes in to_send.items():
+        custom_id = f"state-law-{indexes[0]}"
+        pending[custom_id] = (indexes, bluebook_citation)
+        lines.append(json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": _single_params(bluebook_citation),
+        }))
+
+    substatus = "state_law_search_failed"
+    try:
+        batch_file = client.files.create(
+            file=("state_law_citations.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
         )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/responses",
+            completion_window=BATCH_COMPLETION_WINDOW,
+        )
+        logger.info("Submitted state law verification batch %s with %d citations", batch.id, len(lines))
 
-        output_message = None
-        candidate = None
-        for item in response.output:
-            if item.type == "message":
-                output_message = item
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.error(f"State law verification batch {batch.id} timed out; cancelling")
+                client.batches.cancel(batch.id)
+                substatus = "state_law_batch_timeout"
                 break
-        if output_message is not None and output_message.content is not None:
-            for content_item in output_message.content:
-                if content_item.type == "output_text":
-                    candidate = content_item.text
-                    break
-
-        logger.info(f"OpenAI response for state law citation verification: {candidate}")
-        expected_keys = ["status", "citation", "confidence"]
-        data = {}
-        if isinstance(candidate, dict):
-            data = candidate
-        elif isinstance(candidate, str):
-            try:
-                data = json.loads(_clean_json_response(candidate))
-            except Exception as e:
-                logger.error(f"Error parsing JSON response: {e}")
-                return "error", "state_law_search_failed", None
-
-        logger.info(f"Parsed OpenAI response data: {data}")
-        manifest = {k: (data.get(k) if isinstance(data, dict) else None) for k in expected_keys}
-        for k, v in manifest.items():
-            if isinstance(v, str) and v.strip().lower() in {"null", "none", ""}:
-                manifest[k] = None
-
-        logger.info(f"Manifest for state law citation verification: {manifest}")
-
-        status = manifest.get("status") or "error"
-        citation = manifest.get("citation") or None
-        confidence = manifest.get("confidence") or None
-        return status, f"closest_match: {citation}, confidence: {confidence}", None
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
 
+        if batch.status == "completed" and batch.output_file_id:
+            output = client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                entry = pending.pop(record.get("custom_id"), None)
+                if entry is None:
+                    continue
+                indexes, bluebook_citation = entry
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    logger.error(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                    result = ("error", "state_law_search_failed", None)
+                else:
+                    result = _remember_result(bluebook_citation, _result_from_candidate(
+                        _extract_output_text_from_body(response.get("body") or {})
+                    ))
+                for idx in indexes:
+                    results[idx] = result
+        elif batch.status in _BATCH_TERMINAL_STATUSES:
+            logger.error(f"State law verification batch {batch.id} ended with status {batch.status}")
     except Exception as e:
-        logger.error(f"Error during state law citation verification: {e}")
-        return "error", "state_law_search_failed", None
+        logger.error(f"Error during batched state law citation verification: {e}")
+
+    for indexes, _ in pending.values():
+        for idx in indexes:
+            if results[idx] is None:
+                results[idx] = ("error", substatus, None)
+
+    return results